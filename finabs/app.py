@@ -5,10 +5,10 @@ Main Flask application entry point.
 """
 from flask import Flask
 from flask_cors import CORS
-import threading
 from collections import defaultdict
 
 from utils.logging_config import setup_logging
+from utils.task_table import TaskTable
 from email_scraper.utils.logging_config import setup_email_logging
 from persistence import load_workflows
 
@@ -16,6 +16,13 @@ from persistence import load_workflows
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
 
+# Compress polled JSON responses when flask_compress is installed
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    pass
+
 # Set up logging
 logger = setup_logging()
 email_logger = setup_email_logging()
@@ -23,15 +30,11 @@ email_logger = setup_email_logging()
 # Load persisted workflows
 app.config['workflows'] = load_workflows()
 
-# Background task status and data
-ps_task_data = {}  # Postcode scraper tasks
-gm_task_data = {}  # Google Maps scraper tasks
-es_task_data = {}  # Email scraper tasks
-
-# Store thread objects to allow termination
-ps_threads = {}  # {task_id: [thread1, thread2, ...]}
-gm_threads = {}  # {task_id: thread}
-es_threads = {}  # {task_id: thread}
+# Background task status and data - lock-striped so scraper updates and
+# status polls do not serialize on one table
+ps_task_data = TaskTable()  # Postcode scraper tasks
+gm_task_data = TaskTable()  # Google Maps scraper tasks
+es_task_data = TaskTable()  # Email scraper tasks
 
 # Import routes after app is created to avoid circular imports
 from routes.workflow_routes import workflow_bp
@@ -43,21 +43,30 @@ def get_or_create_database(client: MongoClient, db_name: str) -> Database:
     return client[db_name]
 
 
+# Collections already confirmed to exist, keyed by (database, collection).
+# Saves a full list_collection_names round-trip on every repeat call.
+_known_collections = set()
+
+
 def get_or_create_collection(db: Database, collection_name: str) -> Collection:
     """
     Get or create a collection.
-    
+
     Args:
         db: MongoDB database
         collection_name: Name of the collection
-        
+
     Returns:
         MongoDB collection object
     """
-    # Check if collection exists
-    if collection_name in db.list_collection_names():
+    key = (db.name, collection_name)
+    if key in _known_collections:
         return db[collection_name]
-    
-    # Create collection
-    db.create_collection(collection_name)
+
+    # Check if collection exists
+    if collection_name not in db.list_collection_names():
+        # Create collection
+        db.create_collection(collection_name)
+
+    _known_collections.add(key)
     return db[collection_name]
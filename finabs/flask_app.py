@@ -6,17 +6,18 @@ Flask application for integrating the email scraper.
 import threading
 import time
 import os
-from collections import defaultdict
 from datetime import datetime, UTC
 from typing import Dict, Any, List, Optional
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from pymongo import MongoClient
 
-from db_management.db_connection import connect_to_mongodb, get_or_create_database
+from db_management.db_connection import get_or_create_database
 from db_management.db_operations import load_subsectors_into_mongo, check_collection_exists, get_collection_count
 from utils.city_abbreviations import get_city_name, get_city_abbreviation
 from utils.logging_config import setup_logging as setup_main_logging
+from utils.task_table import TaskTable
 from googlemaps_scraper.utils.logging_config import setup_logging as setup_gmaps_logging
 from googlemaps_scraper.main import run_scraper
 from email_scraper.utils.logging_config import setup_logging as setup_email_logging
@@ -26,7 +27,7 @@ from email_scraper.db_management.db_operations import (
     check_database_status as check_email_db_status,
     get_pending_records
 )
-from postcode_scraper.scraping.scraper import create_worker
+from postcode_scraper.scraping.scraper import ScrapeState, create_worker
 import flask
 
 # Global configuration for headless mode
@@ -75,11 +76,24 @@ DELAY = 0.5
 TIMEOUT = 15
 MAX_RECORDS = 120
 
+# One process-wide client - pymongo's pool multiplexes the concurrent tasks,
+# so each one no longer pays a fresh TLS/SCRAM handshake to the cluster
+MONGO_CLIENT = MongoClient(
+    MONGO_URI,
+    maxPoolSize=10,
+    minPoolSize=2,
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=10000,
+    retryWrites=True,
+)
+
 
 # Background task status and data
-ps_task_data = {}  # Postcode scraper tasks
-gm_task_data = {}  # Google Maps scraper tasks
-es_task_data = {}  # Email scraper tasks
+# Lock-striped so scraper updates and status polls do not serialize on
+# one table
+ps_task_data = TaskTable()  # Postcode scraper tasks
+gm_task_data = TaskTable()  # Google Maps scraper tasks
+es_task_data = TaskTable()  # Email scraper tasks
 
 # Store thread objects to allow termination
 ps_threads = {}  # {task_id: [thread1, thread2, ...]}
@@ -290,7 +304,7 @@ def start_postcode_scrape():
         return jsonify({'error': f'Could not find abbreviation for city: {city}'}), 400
     
     # Check if data already exists in the database
-    client = connect_to_mongodb(MONGO_URI)
+    client = MONGO_CLIENT
     db = get_or_create_database(client, city)
     
     # Determine collection name
@@ -373,7 +387,8 @@ def start_postcode_scrape():
         'next_page_num': 1,
         'stop_scraping': False,
         'all_postcodes': [],
-        'sector_to_subsectors': defaultdict(set),
+        'all_postcodes_set': set(),
+        'sector_to_subsectors': {},
         'should_terminate': False,  # Flag to signal termination
         'headless': headless
     }
@@ -434,7 +449,7 @@ def start_gmaps_scrape():
                 business_collection = "restaurants"
     
     # Check if data exists in the database
-    client = connect_to_mongodb(MONGO_URI)
+    client = MONGO_CLIENT
     
     # Check if database exists
     if db_name not in client.list_database_names():
@@ -553,7 +568,7 @@ def get_postcode_data():
         return jsonify({'error': 'Missing required parameter: city'}), 400
     
     # Connect to MongoDB
-    client = connect_to_mongodb(MONGO_URI)
+    client = MONGO_CLIENT
     
     # Check if database exists
     db_exists = city in client.list_database_names()
@@ -613,7 +628,7 @@ def get_gmaps_data():
         business_collection = "restaurants"
     
     # Connect to MongoDB
-    client = connect_to_mongodb(MONGO_URI)
+    client = MONGO_CLIENT
     
     # Check if database exists
     db_exists = db_name in client.list_database_names()
@@ -906,9 +921,14 @@ def run_postcode_scrape_task(task_id, prefix, city, keyword, auto_run_gmaps=Fals
     task['status'] = 'running'
     
     try:
-        # Create thread-safe locks for this task
-        page_lock = threading.Lock()
+        # Per-task shared state, wired to the task dict's containers so
+        # progress endpoints keep seeing live counts
         results_lock = threading.Lock()
+        state = ScrapeState(
+            postcodes=task['all_postcodes'],
+            postcodes_set=task['all_postcodes_set'],
+            s2s=task['sector_to_subsectors'],
+        )
         
         # Create and start worker threads
         threads = []
@@ -918,14 +938,8 @@ def run_postcode_scrape_task(task_id, prefix, city, keyword, auto_run_gmaps=Fals
                 TIMEOUT, 
                 DELAY, 
                 headless,
-                page_lock,
-                results_lock,
-                lambda: task['stop_scraping'] or task['should_terminate'],  # Check both flags
-                lambda val: task.update({'stop_scraping': val}),
-                lambda: task['next_page_num'],
-                lambda val: task.update({'next_page_num': val}),
-                task['all_postcodes'],
-                task['sector_to_subsectors']
+                state,
+                results_lock
             )
             thread = threading.Thread(target=worker)
             thread.daemon = True
@@ -938,6 +952,7 @@ def run_postcode_scrape_task(task_id, prefix, city, keyword, auto_run_gmaps=Fals
             while thread.is_alive():
                 # Check if task should be terminated
                 if task['should_terminate']:
+                    state.stop.set()
                     logger.info(f"Postcode scraper task {task_id} is terminating, not waiting for threads")
                     break
                 thread.join(1.0)  # Join with timeout to periodically check termination
@@ -956,7 +971,7 @@ def run_postcode_scrape_task(task_id, prefix, city, keyword, auto_run_gmaps=Fals
             collection_name = f"{keyword.replace(' ', '_').lower()}_subsector_queue"
         
         # Load data into MongoDB
-        client = connect_to_mongodb(MONGO_URI)
+        client = MONGO_CLIENT
         db = get_or_create_database(client, db_name)
         load_subsectors_into_mongo(db, task['sector_to_subsectors'], collection_name)
         
@@ -1045,7 +1060,7 @@ def run_gmaps_scrape_task(task_id, db_name, queue_collection, business_collectio
     
     # Connect to MongoDB to get subsector count
     try:
-        client = connect_to_mongodb(MONGO_URI)
+        client = MONGO_CLIENT
         db = client[db_name]
         
         # Check if queue collection exists
@@ -63,11 +63,13 @@ def setup_mongodb(mongo_uri: str, db_name: str, queue_collection: str, business_
                 )
                 # Also create index on businessname for faster lookups
                 rest_col.create_index([("businessname", ASCENDING)], background=True)
-                # Create compound index on subsector and businessname
+                # Unique compound index on subsector and businessname so
+                # MongoDB rejects cross-run duplicates server-side instead
+                # of relying on the in-memory dedup sets
                 rest_col.create_index([
                     ("subsector", ASCENDING),
                     ("businessname", ASCENDING)
-                ], background=True)
+                ], unique=True, background=True)
                 log.info("Created indexes")
             except PyMongoError as e:
                 log.warning("Index creation issue (continuing anyway): %s", e)
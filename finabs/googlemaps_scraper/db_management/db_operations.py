@@ -7,12 +7,13 @@ import json
 import os
 import csv
 import logging
+import random
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
-from pymongo import MongoClient, ASCENDING
+from pymongo import MongoClient, ASCENDING, InsertOne
 from pymongo.collection import Collection
-from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 from bson.objectid import ObjectId
 import time
 
@@ -37,6 +38,20 @@ class MongoJSONEncoder(json.JSONEncoder):
 OUT_DIR = "business_data"
 os.makedirs(OUT_DIR, exist_ok=True)
 
+def backoff(attempt: int, base: float = 0.2, cap: float = 2.0) -> float:
+    """
+    Exponential backoff delay with jitter for retry loops.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        base: Delay for the first retry
+        cap: Maximum delay before jitter
+
+    Returns:
+        Seconds to sleep before the next attempt
+    """
+    return min(cap, base * 2 ** attempt) + random.random() * 0.1
+
 def create_indexes(collection: Collection) -> None:
     """Create indexes for the collection."""
     collection.create_index([("businessname", ASCENDING)], background=True)
@@ -159,7 +174,7 @@ def check_phone_exists(rest_col, phone_number: int) -> bool:
             if attempt < MONGO_RETRY_ATTEMPTS - 1:
                 log.warning("MongoDB error checking phone (attempt %d/%d): %s. Retrying...", 
                            attempt + 1, MONGO_RETRY_ATTEMPTS, e)
-                time.sleep(MONGO_RETRY_DELAY * (attempt + 1))  # Exponential backoff
+                time.sleep(backoff(attempt, base=MONGO_RETRY_DELAY, cap=8.0))
             else:
                 log.error("MongoDB error after %d attempts: %s", MONGO_RETRY_ATTEMPTS, e)
                 return False
@@ -197,7 +212,7 @@ def check_business_exists(rest_col, business_name: str, subsector: str) -> bool:
             if attempt < MONGO_RETRY_ATTEMPTS - 1:
                 log.warning("MongoDB error checking business (attempt %d/%d): %s. Retrying...", 
                            attempt + 1, MONGO_RETRY_ATTEMPTS, e)
-                time.sleep(MONGO_RETRY_DELAY * (attempt + 1))  # Exponential backoff
+                time.sleep(backoff(attempt, base=MONGO_RETRY_DELAY, cap=8.0))
             else:
                 log.error("MongoDB error after %d attempts: %s", MONGO_RETRY_ATTEMPTS, e)
                 return False
@@ -207,6 +222,55 @@ def check_business_exists(rest_col, business_name: str, subsector: str) -> bool:
     
     return False
 
+def insert_records_bulk(collection: Collection, records: List[Dict[str, Any]]) -> int:
+    """
+    Insert a batch of records into MongoDB in a single round-trip.
+
+    Uses an unordered bulk write so one bad document doesn't abort the
+    batch; documents rejected by the bulk write are retried one-by-one
+    through insert_record so its duplicate handling still applies.
+
+    Args:
+        collection: MongoDB collection
+        records: Records to insert
+
+    Returns:
+        Number of records successfully written
+    """
+    log = logging.getLogger("googlemaps_scraper")
+
+    if not records:
+        return 0
+
+    for attempt in range(MONGO_RETRY_ATTEMPTS):
+        try:
+            result = collection.bulk_write(
+                [InsertOne(r) for r in records], ordered=False
+            )
+            return result.inserted_count
+        except BulkWriteError as bwe:
+            # Some documents failed (usually duplicates) - fall back to
+            # per-document insert for just the failing ones
+            failed_indexes = {err["index"] for err in bwe.details.get("writeErrors", [])}
+            written = len(records) - len(failed_indexes)
+            for idx in failed_indexes:
+                if insert_record(collection, records[idx]):
+                    written += 1
+            return written
+        except PyMongoError as e:
+            if attempt < MONGO_RETRY_ATTEMPTS - 1:
+                log.warning("MongoDB error in bulk insert (attempt %d/%d): %s. Retrying...",
+                           attempt + 1, MONGO_RETRY_ATTEMPTS, e)
+                time.sleep(backoff(attempt, base=MONGO_RETRY_DELAY, cap=8.0))
+            else:
+                log.error("MongoDB error after %d attempts: %s", MONGO_RETRY_ATTEMPTS, e)
+                return 0
+        except Exception as e:
+            log.error("Unexpected error in bulk insert: %s", e)
+            return 0
+
+    return 0
+
 def insert_record(collection: Collection, record: Dict[str, Any]) -> bool:
     """
     Insert a record into MongoDB with proper handling of non-English characters.
@@ -3,9 +3,53 @@ browser_manager.py - Browser management
 -------------------------------------
 Functions for managing Selenium browser instances.
 """
+import json
+import logging
+import os
 import random
+import threading
+from collections import deque
+
 from selenium import webdriver
 
+# Where the last browser session's id/executor URL are persisted so a
+# restarted scraper can reattach instead of paying Chrome boot time
+SESSION_FILE = ".gmaps_session.json"
+
+_pool_tuned = False
+
+def _tune_remote_connection_pool() -> None:
+    """
+    Raise the urllib3 pool size behind Selenium's RemoteConnection.
+
+    The default pool holds a single connection, so concurrent WebDriver
+    commands (driver pool workers, CDP calls) serialize on it and urllib3
+    logs "connection pool is full". Applied once per process.
+    """
+    global _pool_tuned
+    if _pool_tuned:
+        return
+    _pool_tuned = True
+
+    try:
+        from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+        original = RemoteConnection._get_connection_manager
+
+        def _get_connection_manager(self):
+            manager = original(self)
+            try:
+                manager.connection_pool_kw.update({"maxsize": 32, "block": False})
+            except Exception:
+                pass
+            return manager
+
+        RemoteConnection._get_connection_manager = _get_connection_manager
+    except Exception as e:
+        logging.getLogger("googlemaps_scraper").debug(
+            "Could not tune RemoteConnection pool: %s", e
+        )
+
 def make_driver(headless: bool) -> webdriver.Chrome:
     """
     Create a Selenium WebDriver.
@@ -16,6 +60,8 @@ def make_driver(headless: bool) -> webdriver.Chrome:
     Returns:
         Selenium WebDriver
     """
+    _tune_remote_connection_pool()
+
     ua = random.choice(
         [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -62,5 +108,120 @@ def make_driver(headless: bool) -> webdriver.Chrome:
     
     # Set page load strategy to eager for faster loading
     opts.page_load_strategy = 'eager'
-    
-    return webdriver.Chrome(options=opts)
+
+    driver = webdriver.Chrome(options=opts)
+    _save_session(driver)
+    return driver
+
+
+def _save_session(driver: webdriver.Chrome) -> None:
+    """Persist the session id and executor URL for later reattachment."""
+    try:
+        with open(SESSION_FILE, "w") as f:
+            json.dump({
+                "session_id": driver.session_id,
+                "executor_url": driver.command_executor._url
+            }, f)
+    except Exception as e:
+        logging.getLogger("googlemaps_scraper").debug(
+            "Could not persist browser session: %s", e
+        )
+
+
+def _attach_to_session(executor_url: str, session_id: str) -> webdriver.Remote:
+    """
+    Build a Remote driver bound to an already-running browser session.
+
+    webdriver.Remote always negotiates a new session in its constructor,
+    so the newSession command is stubbed out for the duration of the
+    construction and the saved session id is substituted.
+    """
+    from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+    original_execute = RemoteWebDriver.execute
+
+    def _no_new_session(self, command, params=None):
+        if command == "newSession":
+            return {
+                "success": 0,
+                "sessionId": session_id,
+                "value": {"sessionId": session_id, "capabilities": {}}
+            }
+        return original_execute(self, command, params)
+
+    RemoteWebDriver.execute = _no_new_session
+    try:
+        driver = webdriver.Remote(
+            command_executor=executor_url,
+            options=webdriver.ChromeOptions()
+        )
+        driver.session_id = session_id
+    finally:
+        RemoteWebDriver.execute = original_execute
+
+    return driver
+
+
+def attach_or_make_driver(headless: bool) -> webdriver.Chrome:
+    """
+    Reattach to the previous browser session if it is still alive,
+    otherwise create a fresh driver.
+
+    Returns:
+        Selenium WebDriver
+    """
+    log = logging.getLogger("googlemaps_scraper")
+
+    if os.path.exists(SESSION_FILE):
+        try:
+            with open(SESSION_FILE) as f:
+                saved = json.load(f)
+            driver = _attach_to_session(saved["executor_url"], saved["session_id"])
+            # Probe the session - this raises if the browser is gone
+            driver.current_url
+            log.info("Reattached to existing browser session %s", saved["session_id"])
+            return driver
+        except Exception as e:
+            log.debug("Could not reattach to saved session (%s), starting fresh", e)
+            try:
+                os.remove(SESSION_FILE)
+            except OSError:
+                pass
+
+    return make_driver(headless)
+
+
+class DriverPool:
+    """
+    Pool of pre-warmed Chrome drivers shared by concurrent subsector workers.
+
+    Chrome cold-start costs seconds and hundreds of MB, so workers check
+    drivers out and return them instead of creating one per subsector.
+    """
+
+    def __init__(self, size: int, headless: bool):
+        self._headless = headless
+        self._lock = threading.Lock()
+        self._drivers = deque(make_driver(headless) for _ in range(max(1, size)))
+
+    def acquire_driver(self) -> webdriver.Chrome:
+        """Check a driver out of the pool, creating one if the pool is empty."""
+        with self._lock:
+            if self._drivers:
+                return self._drivers.popleft()
+        return make_driver(self._headless)
+
+    def release_driver(self, driver: webdriver.Chrome) -> None:
+        """Return a driver to the pool for reuse."""
+        with self._lock:
+            self._drivers.append(driver)
+
+    def close_all(self) -> None:
+        """Quit every pooled driver."""
+        log = logging.getLogger("googlemaps_scraper")
+        with self._lock:
+            while self._drivers:
+                try:
+                    self._drivers.popleft().quit()
+                except Exception as e:
+                    log.debug("Error closing pooled driver: %s", e)
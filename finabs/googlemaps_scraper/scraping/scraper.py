@@ -3,6 +3,7 @@ scraper.py - Core scraping functionality
 ---------------------------------------
 Functions for scraping business data from Google Maps.
 """
+import json
 import logging
 import random
 import re
@@ -23,13 +24,13 @@ from selenium.common.exceptions import (
     ElementClickInterceptedException,
     ElementNotInteractableException
 )
-from selenium.webdriver import ActionChains
+from lxml import html as lxml_html
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from googlemaps_scraper.db_management.db_operations import insert_record
+from googlemaps_scraper.db_management.db_operations import backoff, insert_records_bulk
 from googlemaps_scraper.utils.config import (
     SEARCH_DELAY_MIN, SEARCH_DELAY_MAX,
     CLICK_WAIT_MIN, CLICK_WAIT_MAX,
@@ -42,7 +43,7 @@ from googlemaps_scraper.utils.config import (
     REVIEWS_CSS, REVIEWS_XPATH, ADDRESS_SELECTORS,
     WEBSITE_SELECTORS, PHONE_SELECTORS, TILE_NAME_CSS,
     FALLBACK_NAME, FALLBACK_STARS, FALLBACK_REVIEWS,
-    CARD_PROCESSING_DELAY
+    CARD_PROCESSING_DELAY, CARD_PANE_CSS, BULK_INSERT_SIZE
 )
 from googlemaps_scraper.utils.logging_config import ARROW
 
@@ -57,6 +58,120 @@ BOLD = "\033[1m"
 UNDERLINE = "\033[4m"
 RESET = "\033[0m"
 
+# "End of list" indicators - built once so the per-scroll check allocates nothing
+_END_MARKERS = (
+    "You've reached the end of the list",
+    "No more results",
+    "End of results",
+    "No additional results found"
+)
+_END_MARKERS_JS = """
+    var markers = %s;
+    var text = document.body ? document.body.innerText : "";
+    for (var i = 0; i < markers.length; i++) {
+        if (text.indexOf(markers[i]) !== -1) {
+            return markers[i];
+        }
+    }
+    return null;
+""" % json.dumps(list(_END_MARKERS))
+
+# Single round-trip tile fingerprint: name + persistent data attributes,
+# reading innerHTML only when every data attribute is empty
+_TILE_ID_JS = """
+    var t = arguments[0];
+    var cid = t.getAttribute('data-cid') || '';
+    var idx = t.getAttribute('data-result-index') || '';
+    var item = t.getAttribute('data-item-id') || '';
+    var nameEl = t.querySelector(arguments[1]);
+    var name = nameEl ? nameEl.innerText.trim() : '';
+    var htmlPrefix = '';
+    if (!cid && !idx && !item) {
+        // Limit length to avoid excessive memory usage
+        htmlPrefix = t.innerHTML.substring(0, 100);
+    }
+    return [name, cid, idx, item, htmlPrefix];
+"""
+
+# MutationObserver hook that flips window.__cardReady as soon as the card
+# name node appears, so readiness is event-driven instead of re-querying
+# the DOM from Python every 500ms
+_CARD_READY_JS = """
+    var selector = %s;
+    window.__cardReady = !!document.querySelector(selector);
+    if (window.__cardReady) { return; }
+    if (window.__cardReadyObserver) { window.__cardReadyObserver.disconnect(); }
+    window.__cardReadyObserver = new MutationObserver(function() {
+        if (document.querySelector(selector)) {
+            window.__cardReady = true;
+            window.__cardReadyObserver.disconnect();
+            window.__cardReadyObserver = null;
+        }
+    });
+    window.__cardReadyObserver.observe(document.body, {childList: true, subtree: true});
+""" % json.dumps(NAME_CSS + ", " + FALLBACK_NAME)
+
+def wait_for_card_ready(driver: webdriver.Chrome, timeout: float = 12) -> bool:
+    """
+    Wait for the business card to render its name node.
+
+    Installs the MutationObserver hook and polls the single boolean it
+    sets at 50ms granularity - much cheaper and faster to trip than the
+    old triple find_elements poll.
+
+    Returns:
+        True once the card is ready, False on timeout.
+    """
+    try:
+        driver.execute_script(_CARD_READY_JS)
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script("return window.__cardReady === true")
+        )
+        return True
+    except TimeoutException:
+        return False
+
+# Batch variant of _TILE_ID_JS: fingerprint every tile in one round-trip,
+# including its vertical position for sorting
+_TILE_BATCH_JS = """
+    var tiles = arguments[0];
+    var nameSel = arguments[1];
+    var out = [];
+    for (var i = 0; i < tiles.length; i++) {
+        var t = tiles[i];
+        var cid = t.getAttribute('data-cid') || '';
+        var idx = t.getAttribute('data-result-index') || '';
+        var item = t.getAttribute('data-item-id') || '';
+        var nameEl = t.querySelector(nameSel);
+        var name = nameEl ? nameEl.innerText.trim() : '';
+        var htmlPrefix = '';
+        if (!cid && !idx && !item) {
+            // Limit length to avoid excessive memory usage
+            htmlPrefix = t.innerHTML.substring(0, 100);
+        }
+        out.push([name, cid, idx, item, htmlPrefix, t.getBoundingClientRect().top]);
+    }
+    return out;
+"""
+
+def cdp_eval(driver: webdriver.Chrome, js: str) -> Any:
+    """
+    Evaluate a JS function body via Chrome DevTools Protocol.
+
+    Runtime.evaluate with returnByValue skips the per-call serialization
+    of the JSON-wire execute_script endpoint, which matters for the
+    extractors that run on every card. Falls back to execute_script if
+    the CDP command is unavailable.
+    """
+    try:
+        result = driver.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {"expression": "(function() {%s})()" % js, "returnByValue": True}
+        )
+        return result.get("result", {}).get("value")
+    except Exception:
+        return driver.execute_script(js)
+
 def rdelay(a: float, b: float, fast_mode: bool = False):
     """Random delay with option for fast mode"""
     if fast_mode:
@@ -64,9 +179,24 @@ def rdelay(a: float, b: float, fast_mode: bool = False):
     else:
         time.sleep(random.uniform(a, b))
 
+# Precompiled patterns for the per-card text cleanup
+_NON_DIGITS_RE = re.compile(r"\D")
+_HAS_DIGIT_RE = re.compile(r"\d")
+
+# Seconds between driver-alive probes in the scraping loop
+_ALIVE_CHECK_INTERVAL = 30.0
+
 def digits(text: str) -> str:
     """Extract digits from text."""
-    return re.sub(r"\D", "", text or "")
+    return _NON_DIGITS_RE.sub("", text or "")
+
+def _trunc(text: str) -> str:
+    """Truncate long values for log output."""
+    return text[:30] + "..." if len(text) > 30 else text
+
+def _name_key(name: str) -> int:
+    """Hash key for the per-subsector business dedup set."""
+    return hash(name.casefold())
 
 def normalize_text(text: str) -> str:
     """
@@ -150,7 +280,7 @@ def extract_address(driver: webdriver.Chrome, debug: bool = False) -> str:
                     log.debug("Found potential address element: %s", text)
                 
                 # Check if text looks like an address (contains numbers and letters)
-                if re.search(r'\d', text) and len(text) > 5:
+                if _HAS_DIGIT_RE.search(text) and len(text) > 5:
                     if debug:
                         log.debug("Extracted address: %s", text)
                     return text
@@ -161,7 +291,7 @@ def extract_address(driver: webdriver.Chrome, debug: bool = False) -> str:
     
     # If we still don't have an address, try JavaScript
     try:
-        address = driver.execute_script("""
+        address = cdp_eval(driver, """
             // Try to find address elements
             var addressElements = [
                 // Buttons with address
@@ -239,7 +369,7 @@ def extract_website(driver: webdriver.Chrome, business_name: str, debug: bool =
     
     # If we still don't have a website, try JavaScript
     try:
-        website = driver.execute_script("""
+        website = cdp_eval(driver, """
             // Try to find website elements
             var websiteElements = [
                 // Direct website links
@@ -299,7 +429,7 @@ def extract_phone_number(driver: webdriver.Chrome, business_name: str, debug: bo
                     log.debug(f"Found potential phone element for {business_name}: {text}")
                 
                 # Check if text looks like a phone number
-                if re.search(r'\d', text):  # Contains at least one digit
+                if _HAS_DIGIT_RE.search(text):  # Contains at least one digit
                     digits_only = digits(text)
                     if digits_only and len(digits_only) >= 5:  # Reasonable phone number length
                         if debug:
@@ -312,7 +442,7 @@ def extract_phone_number(driver: webdriver.Chrome, business_name: str, debug: bo
     
     # If we still don't have a phone number, try JavaScript
     try:
-        phone_text = driver.execute_script("""
+        phone_text = cdp_eval(driver, """
             // Try to find phone elements
             var phoneElements = [
                 // Direct phone buttons
@@ -345,6 +475,116 @@ def extract_phone_number(driver: webdriver.Chrome, business_name: str, debug: bo
     log.debug(f"No phone number found for {business_name}")
     return None
 
+_CARD_HTML_JS = """
+    var el = document.querySelector(%s);
+    return el ? el.outerHTML : '';
+""" % json.dumps(CARD_PANE_CSS)
+
+def _first_matching_text(tree, selectors) -> str:
+    """Return the first non-empty text matched by a CSS/XPath selector list."""
+    for selector in selectors:
+        try:
+            nodes = tree.xpath(selector) if selector.startswith('/') else tree.cssselect(selector)
+        except Exception:
+            continue
+        for node in nodes:
+            text = normalize_text(node.text_content().strip())
+            if text:
+                return text
+    return ""
+
+def extract_card_fields(driver: webdriver.Chrome, debug: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Extract all card fields from a single DOM snapshot.
+
+    Fetches the card pane's outerHTML in one WebDriver round-trip and
+    runs the selector fallbacks in Python via lxml, instead of issuing
+    one find_element round-trip per selector per field. Returns None if
+    the snapshot could not be taken or no name was found, so the caller
+    can fall back to the per-field Selenium extractors.
+    """
+    log = logging.getLogger("googlemaps_scraper")
+
+    try:
+        card_html = cdp_eval(driver, _CARD_HTML_JS)
+        if not card_html:
+            return None
+        tree = lxml_html.fromstring(card_html)
+    except Exception as e:
+        log.debug("Card snapshot parse failed: %s", e)
+        return None
+
+    name = _first_matching_text(tree, (NAME_CSS, NAME_XPATH, FALLBACK_NAME))
+    if not name:
+        return None
+
+    stars = _first_matching_text(tree, (RATING_CSS, RATING_XPATH, FALLBACK_STARS)) or "N/A"
+    rev_raw = _first_matching_text(tree, (REVIEWS_CSS, REVIEWS_XPATH, FALLBACK_REVIEWS))
+    reviews = int(_NON_DIGITS_RE.sub("", rev_raw)) if rev_raw else 0
+
+    # Address: first match that looks like an address (digits and some length)
+    address = "N/A"
+    for selector in ADDRESS_SELECTORS:
+        try:
+            nodes = tree.xpath(selector) if selector.startswith('/') else tree.cssselect(selector)
+        except Exception:
+            continue
+        for node in nodes:
+            text = normalize_text(node.text_content().strip())
+            if _HAS_DIGIT_RE.search(text) and len(text) > 5:
+                address = text
+                break
+        if address != "N/A":
+            break
+
+    # Website: prefer anchor hrefs, then website-looking text
+    website = "N/A"
+    for selector in WEBSITE_SELECTORS:
+        try:
+            nodes = tree.xpath(selector) if selector.startswith('/') else tree.cssselect(selector)
+        except Exception:
+            continue
+        for node in nodes:
+            if node.tag == 'a':
+                href = node.get('href')
+                if href and 'google.com' not in href and href.startswith('http'):
+                    website = href
+                    break
+            text = normalize_text(node.text_content().strip())
+            if text and ('.' in text) and ('http' in text or 'www' in text):
+                website = text
+                break
+        if website != "N/A":
+            break
+
+    # Phone: first selector match with enough digits
+    phone_int = None
+    for selector in PHONE_SELECTORS:
+        try:
+            nodes = tree.cssselect(selector)
+        except Exception:
+            continue
+        for node in nodes:
+            digits_only = digits(normalize_text(node.text_content().strip()))
+            if digits_only and len(digits_only) >= 5:
+                phone_int = int(digits_only)
+                break
+        if phone_int:
+            break
+
+    if debug:
+        log.debug("Card snapshot extraction: name=%s, stars=%s, reviews=%s, address=%s, website=%s, phone=%s",
+                  name, stars, reviews, address, website, phone_int)
+
+    return {
+        "name": name,
+        "stars": stars,
+        "reviews": reviews,
+        "address": address,
+        "website": website,
+        "phone": phone_int,
+    }
+
 def dismiss_banners(driver: webdriver.Chrome):
     """Close GDPR or consent banners if present."""
     log = logging.getLogger("googlemaps_scraper")
@@ -365,24 +605,14 @@ def dismiss_banners(driver: webdriver.Chrome):
 def check_end_of_results(driver: webdriver.Chrome) -> bool:
     """Check if we've reached the end of search results."""
     log = logging.getLogger("googlemaps_scraper")
-    
+
     try:
-        # Look for "end of list" indicators
-        end_markers = [
-            "You've reached the end of the list",
-            "No more results",
-            "End of results",
-            "No additional results found"
-        ]
-        
-        for marker in end_markers:
-            try:
-                if driver.find_element(By.XPATH, f"//*[contains(text(), '{marker}')]"):
-                    log.info("Detected end of results marker: %s", marker)
-                    return True
-            except NoSuchElementException:
-                continue
-        
+        # Scan for "end of list" indicators in a single JS round-trip
+        marker = cdp_eval(driver, _END_MARKERS_JS)
+        if marker:
+            log.info("Detected end of results marker: %s", marker)
+            return True
+
         # Check if the scrollable feed has reached its maximum scroll position
         try:
             feed = driver.find_element(By.CSS_SELECTOR, 'div[role="feed"]')
@@ -509,36 +739,32 @@ def get_tile_position(driver: webdriver.Chrome, tile) -> int:
     except Exception:
         return 0
 
+def build_tile_identifier(name: str, data_cid: str, data_index: str,
+                          data_item_id: str, html_prefix: str) -> Tuple[str, str]:
+    """Build a (tile_id, name) pair from JS-fetched tile attributes."""
+    name = normalize_text((name or "").strip())
+
+    # If we have any persistent attributes, use them
+    if data_cid or data_index or data_item_id:
+        return f"{name}|{data_cid}|{data_index}|{data_item_id}", name
+
+    # Fallback to a hash of the element's HTML content as a fingerprint
+    # This is more stable than position which changes with scrolling
+    html_hash = hash(html_prefix)
+
+    return f"{name}|{html_hash}", name
+
 def get_tile_identifier(driver: webdriver.Chrome, tile) -> str:
     """
     Get a unique identifier for a tile based on persistent attributes.
     This helps track which tiles have been processed.
     """
     try:
-        # Get the business name
-        name = get_tile_name(tile)
-        
-        # Try to get persistent data attributes
-        data_cid = tile.get_attribute("data-cid") or ""
-        data_index = tile.get_attribute("data-result-index") or ""
-        data_item_id = tile.get_attribute("data-item-id") or ""
-        
-        # If we have any persistent attributes, use them
-        if data_cid or data_index or data_item_id:
-            return f"{name}|{data_cid}|{data_index}|{data_item_id}"
-        
-        # Fallback to using the element's HTML content as a fingerprint
-        # This is more stable than position which changes with scrolling
-        inner_html = driver.execute_script("""
-            var html = arguments[0].innerHTML;
-            // Limit length to avoid excessive memory usage
-            return html.substring(0, 100);
-        """, tile)
-        
-        # Create a hash of the inner HTML for a more compact identifier
-        html_hash = hash(inner_html)
-        
-        return f"{name}|{html_hash}"
+        # Fetch name, data attributes and (only when needed) an HTML
+        # fingerprint in one JS round-trip instead of 4+ WebDriver calls
+        parts = driver.execute_script(_TILE_ID_JS, tile, TILE_NAME_CSS)
+        tile_id, _ = build_tile_identifier(*parts)
+        return tile_id
     except Exception as e:
         # If all else fails, just use the name
         try:
@@ -546,59 +772,88 @@ def get_tile_identifier(driver: webdriver.Chrome, tile) -> str:
         except:
             return f"unknown_tile_{time.time()}"
 
-def get_unprocessed_tiles(driver: webdriver.Chrome, processed_tile_ids: Set[str], code: str) -> List[Tuple[Any, str]]:
+def get_unprocessed_tiles(driver: webdriver.Chrome, processed_tile_ids: Set[int], code: str) -> List[Tuple[Any, int, str]]:
     """
     Get all visible tiles that haven't been processed yet, sorted by vertical position.
-    
+
+    Identifiers, names and positions for every tile are fetched in a single
+    JS round-trip instead of per-tile WebDriver calls; the cached name is
+    returned so callers don't need a fresh tile.text access.
+
     Args:
         driver: Selenium WebDriver
-        processed_tile_ids: Set of already processed tile IDs
+        processed_tile_ids: Set of already processed (hashed) tile IDs
         code: Subsector code for logging
-        
+
     Returns:
-        List of tuples (tile_element, tile_id) sorted by vertical position
+        List of tuples (tile_element, tile_key, tile_name) sorted by vertical position
     """
     log = logging.getLogger("googlemaps_scraper")
-    
+
     try:
         # Get all visible tiles
         all_tiles = driver.find_elements(By.CSS_SELECTOR, "div.Nv2PK")
         log.debug("%s %s Found %d total visible tiles", code, ARROW, len(all_tiles))
-        
-        # Filter out already processed tiles and get positions
-        unprocessed_tiles = []
-        for tile in all_tiles:
+
+        if not all_tiles:
+            return []
+
+        # Fingerprint every tile in one round-trip
+        try:
+            batch = driver.execute_script(_TILE_BATCH_JS, all_tiles, TILE_NAME_CSS)
+        except Exception as e:
+            log.debug("%s %s Batch tile fingerprint failed: %s", code, ARROW, e)
+            batch = None
+
+        # Fingerprint every tile once - ids are stored as hashes so the
+        # dedup set holds ints instead of long identifier strings
+        candidates = []
+        for i, tile in enumerate(all_tiles):
             try:
-                tile_id = get_tile_identifier(driver, tile)
-                if tile_id not in processed_tile_ids:
+                if batch is not None and i < len(batch):
+                    *parts, position = batch[i]
+                    tile_id, name = build_tile_identifier(*parts)
+                else:
+                    # Per-tile fallback if the batch script failed
+                    tile_id = get_tile_identifier(driver, tile)
+                    name = get_tile_name(tile)
                     position = get_tile_position(driver, tile)
-                    unprocessed_tiles.append((tile, tile_id, position))
+                candidates.append((tile, hash(tile_id), name, position))
             except Exception as e:
                 log.debug("%s %s Error processing tile: %s", code, ARROW, e)
                 continue
-        
+
+        # Fast path: every visible tile has already been processed
+        if candidates and processed_tile_ids.issuperset(c[1] for c in candidates):
+            log.info("%s %s Found 0 unprocessed tiles", code, ARROW)
+            return []
+
+        unprocessed_tiles = [c for c in candidates if c[1] not in processed_tile_ids]
+
         # Sort by vertical position (top to bottom)
-        unprocessed_tiles.sort(key=lambda x: x[2])
-        
-        # Return just the tile elements and their IDs
-        result = [(t[0], t[1]) for t in unprocessed_tiles]
+        unprocessed_tiles.sort(key=lambda x: x[3])
+
+        # Return the tile elements with their IDs and cached names
+        result = [(t[0], t[1], t[2]) for t in unprocessed_tiles]
         log.info("%s %s Found %d unprocessed tiles", code, ARROW, len(result))
         return result
     except Exception as e:
         log.error("%s %s Error getting unprocessed tiles: %s", code, ARROW, e)
         return []
 
-def safe_click_tile(driver: webdriver.Chrome, tile, code: str, tile_idx: int, total_tiles: int) -> bool:
+def safe_click_tile(driver: webdriver.Chrome, tile, code: str, tile_idx: int, total_tiles: int, tile_name: str = "") -> bool:
     """Safely click a tile with improved reliability."""
     log = logging.getLogger("googlemaps_scraper")
-    
+
     # Check if a card is already open - if so, don't proceed
     if is_card_open(driver):
         log.warning("%s %s A card appears to be already open before clicking new tile", code, ARROW)
         return False
-    
-    # Always log which tile we're trying to click
-    tile_name = get_tile_name(tile)
+
+    # Always log which tile we're trying to click - reuse the cached name
+    # from the batch fingerprint when we have it
+    if not tile_name:
+        tile_name = get_tile_name(tile)
     log.info("%s %s %sClicking tile %d/%d: %s%s", code, ARROW, CYAN + BOLD, tile_idx + 1, total_tiles, tile_name, RESET)
     
     for attempt in range(MAX_STALE_RETRIES):
@@ -616,7 +871,7 @@ def safe_click_tile(driver: webdriver.Chrome, tile, code: str, tile_idx: int, to
             except Exception:
                 if attempt < MAX_STALE_RETRIES - 1:
                     log.debug("%s %s Tile visibility check failed, retrying", code, ARROW)
-                    time.sleep(0.5)
+                    time.sleep(backoff(attempt))
                     continue
                 else:
                     return False
@@ -637,105 +892,63 @@ def safe_click_tile(driver: webdriver.Chrome, tile, code: str, tile_idx: int, to
             if attempt < MAX_STALE_RETRIES - 1:
                 log.debug("%s %s Stale element, retrying click (%d/%d)", 
                          code, ARROW, attempt + 1, MAX_STALE_RETRIES)
-                time.sleep(0.5)
+                time.sleep(backoff(attempt))
             else:
                 log.warning("%s %s Stale element, max retries reached for tile: %s", code, ARROW, tile_name)
                 return False
         except Exception as e:
             log.warning("%s %s Click error: %s", code, ARROW, e)
             if attempt < MAX_STALE_RETRIES - 1:
-                time.sleep(0.5)
+                time.sleep(backoff(attempt))
             else:
                 return False
     
     return False
 
 def safe_close_card(driver: webdriver.Chrome) -> bool:
-    """Safely close the card with retry logic."""
+    """Safely close the card with a single Escape dispatch."""
     log = logging.getLogger("googlemaps_scraper")
-    
-    # Try multiple methods to close the card
-    for attempt in range(MAX_STALE_RETRIES):
+
+    # A single ESC via CDP closes the card in one round-trip. The old
+    # ActionChains path was wrapped in a stale-element retry loop, but
+    # key dispatch is not element-bound so the retries bought nothing.
+    try:
+        driver.execute_cdp_cmd("Input.dispatchKeyEvent", {
+            "type": "keyDown", "key": "Escape", "code": "Escape",
+            "windowsVirtualKeyCode": 27
+        })
+        driver.execute_cdp_cmd("Input.dispatchKeyEvent", {
+            "type": "keyUp", "key": "Escape", "code": "Escape",
+            "windowsVirtualKeyCode": 27
+        })
+    except Exception as e:
+        # JS fallback only when the CDP call itself raises
+        log.debug("CDP Escape dispatch failed (%s), trying JS fallback", e)
         try:
-            # Method 1: Try clicking the specific close button first (X in top-right corner)
-            close_button_selectors = [
-                # Specific close button selector provided by user
-                "#QA0Szd > div > div > div.w6VYqd > div.bJzME.Hu9e2e.tTVLSc > div > div.e07Vkf.kA9KIf > div > div > div.BHymgf.eiJcBe.bJUD0c > div > div > div:nth-child(3) > span > button",
-                # More generic selectors as fallbacks
-                "button[aria-label='Close']",
-                "button[jsaction*='closeButton']",
-                "button.VfPpkd-icon-LgbsSe[data-disable-idom='true']",
-                "[role='button'][aria-label='Close']",
-                "button.mL3xi",
-                # Generic close button with X
-                "button span[aria-hidden='true']:contains('×')"
-            ]
-            
-            for selector in close_button_selectors:
-                try:
-                    close_buttons = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if close_buttons and len(close_buttons) > 0:
-                        for btn in close_buttons:
-                            if btn.is_displayed():
-                                log.info("Found close button, clicking it directly")
-                                # Try direct click first
-                                try:
-                                    btn.click()
-                                    time.sleep(1.0)  # Wait for animation
-                                    return True
-                                except:
-                                    # If direct click fails, try JavaScript click
-                                    driver.execute_script("arguments[0].click();", btn)
-                                    time.sleep(1.0)  # Wait for animation
-                                    return True
-                except Exception as e:
-                    log.debug(f"Error with close button selector {selector}: {e}")
-                    continue
-            
-            # Method 2: Try Escape key if button click didn't work
-            log.debug("Close button not found or not clickable, trying Escape key")
-            actions = ActionChains(driver)
-            actions.send_keys(Keys.ESCAPE).perform()
-            time.sleep(1.0)  # Wait for animation
-            
-            # Check if card is still open
-            if not is_card_open(driver):
-                return True
-                
-        except Exception as e:
-            if attempt < MAX_STALE_RETRIES - 1:
-                log.debug("Error closing card, retrying: %s", e)
-                time.sleep(0.5)
-            else:
-                log.debug("Failed to close card after %d attempts: %s", MAX_STALE_RETRIES, e)
-                # Try JavaScript fallback
-                try:
-                    driver.execute_script("""
-                        // Try to find and click any close buttons
-                        var closeButtons = [
-                            ...document.querySelectorAll('button[aria-label="Close"]'),
-                            ...document.querySelectorAll('button[jsaction*="closeButton"]'),
-                            ...document.querySelectorAll('[role="button"][aria-label="Close"]'),
-                            ...document.querySelectorAll('button.mL3xi')
-                        ];
-                        
-                        for (let btn of closeButtons) {
-                            if (btn && btn.offsetParent !== null) {
-                                btn.click();
-                                return;
-                            }
-                        }
-                        
-                        // If no buttons found, try to dispatch Escape key event
-                        document.dispatchEvent(new KeyboardEvent('keydown', {'key': 'Escape'}));
-                    """)
-                    time.sleep(1.5)
-                    return not is_card_open(driver)
-                except:
-                    return False
-    
-    # If we get here, all attempts failed
-    return False
+            driver.execute_script("""
+                // Try to find and click any close buttons
+                var closeButtons = [
+                    ...document.querySelectorAll('button[aria-label="Close"]'),
+                    ...document.querySelectorAll('button[jsaction*="closeButton"]'),
+                    ...document.querySelectorAll('[role="button"][aria-label="Close"]'),
+                    ...document.querySelectorAll('button.mL3xi')
+                ];
+
+                for (let btn of closeButtons) {
+                    if (btn && btn.offsetParent !== null) {
+                        btn.click();
+                        return;
+                    }
+                }
+
+                // If no buttons found, try to dispatch Escape key event
+                document.dispatchEvent(new KeyboardEvent('keydown', {'key': 'Escape'}));
+            """)
+        except Exception:
+            return False
+
+    time.sleep(1.0)  # Wait for animation
+    return not is_card_open(driver)
 
 def is_card_open(driver: webdriver.Chrome) -> bool:
     """
@@ -959,7 +1172,11 @@ def scrape_subsector(
         Tuple of (records, card_count)
     """
     log = logging.getLogger("googlemaps_scraper")
-    
+
+    # Bind the callback once so the hot loop does a plain call instead of
+    # re-testing "termination_check and termination_check()" everywhere
+    term = termination_check or (lambda: False)
+
     code = doc["subsector"].strip()
     log.info("=" * 60)
     log.info("Starting scrape for subsector: %s", code)
@@ -968,7 +1185,7 @@ def scrape_subsector(
     start_time = datetime.now()
 
     # Check for termination request
-    if termination_check and termination_check():
+    if term():
         log.info("%s %s Termination requested before starting", code, ARROW)
         return [], 0
     
@@ -984,7 +1201,7 @@ def scrape_subsector(
         dismiss_banners(driver)
 
         # Check for termination request
-        if termination_check and termination_check():
+        if term():
             log.info("%s %s Termination requested during search setup", code, ARROW)
             return [], 0
 
@@ -1015,22 +1232,39 @@ def scrape_subsector(
     
     # Track processed businesses to avoid duplicates WITHIN THIS SUBSECTOR ONLY
     # This is reset for each new subsector
-    processed_businesses: Set[str] = set()
+    processed_businesses: Set[int] = set()  # hashed casefolded business names
     processed_phones: Set[int] = set()
-    processed_tile_ids: Set[str] = set()  # Track processed tile IDs
-    
+    processed_tile_ids: Set[int] = set()  # hashed tile IDs
+
+    # Buffer records and write them to MongoDB in batches - one round-trip
+    # per BULK_INSERT_SIZE records instead of one per business
+    pending: List[dict] = []
+
+    def flush_pending():
+        if pending:
+            insert_records_bulk(rest_col, pending)
+            pending.clear()
+
     # Track consecutive stale element errors
     consecutive_stale_errors = 0
     total_errors = 0
+
+    # Tiles processed in the current batch - also read by the stale-error
+    # threshold check at the top of the loop
+    new_tiles_processed = 0
     
     # Track consecutive scrolls with no new data
     consecutive_no_new_data = 0
+
+    # Revalidate the browser session at most this often
+    last_alive_check = time.monotonic()
     
     # At the beginning of the main while loop:
     while total_cards < RESULT_LIMIT and scroll_attempts < MAX_SCROLL_ATTEMPTS:
         # Check for termination request more frequently
-        if termination_check and termination_check():
+        if term():
             log.info("%s %s Termination requested during scraping loop", code, ARROW)
+            flush_pending()
             return records, total_cards
         
         # Ensure no card is open before proceeding
@@ -1044,33 +1278,45 @@ def scrape_subsector(
                 )
             except Exception as e:
                 log.error("%s %s Error refreshing page: %s", code, ARROW, e)
+                flush_pending()
                 return records, total_cards
                 
-        # Check if we need to refresh the page due to too many stale errors
+        # Too many consecutive stale errors: skip ahead, unless the last
+        # batch still made progress, in which case just reset the counter
         if consecutive_stale_errors >= PAGE_REFRESH_THRESHOLD:
-            log.warning("%s %s Too many consecutive stale errors, skipping to next subsector", code, ARROW)
-            break  # Instead of refreshing, just move to the next subsector
-
-        # Only consider stale errors a problem if we're not making progress
-        if consecutive_stale_errors >= PAGE_REFRESH_THRESHOLD and new_tiles_processed == 0:
-            log.warning("%s %s Too many consecutive stale errors with no progress, skipping to next subsector", code, ARROW)
-            break  # Instead of refreshing, just move to the next subsector
-        elif consecutive_stale_errors >= PAGE_REFRESH_THRESHOLD:
-            # If we're still making progress despite stale errors, just reset the counter
+            if new_tiles_processed == 0:
+                log.warning("%s %s Too many consecutive stale errors with no progress, skipping to next subsector", code, ARROW)
+                break  # Instead of refreshing, just move to the next subsector
             log.info("%s %s Resetting stale error counter since we're still making progress", code, ARROW)
             consecutive_stale_errors = 0
                 
-        # Check if driver is still alive
-        try:
-            # Try to get the current URL - this will fail if the driver is dead
-            driver.current_url
-        except Exception:
-            log.error("%s %s Driver session is no longer valid", code, ARROW)
-            return records, total_cards
+        # Check if driver is still alive - at most once per interval, since
+        # each probe is a full WebDriver round-trip
+        now = time.monotonic()
+        if now - last_alive_check >= _ALIVE_CHECK_INTERVAL:
+            last_alive_check = now
+            try:
+                # Browser.getVersion answers without touching the renderer,
+                # so it's cheaper than a current_url probe
+                driver.execute_cdp_cmd("Browser.getVersion", {})
+            except AttributeError:
+                # Reattached drivers are plain webdriver.Remote, which has
+                # no CDP support - probe the session the ordinary way
+                try:
+                    driver.current_url
+                except Exception:
+                    log.error("%s %s Driver session is no longer valid", code, ARROW)
+                    flush_pending()
+                    return records, total_cards
+            except Exception:
+                log.error("%s %s Driver session is no longer valid", code, ARROW)
+                flush_pending()
+                return records, total_cards
                 
         # Check if we need to reset the driver due to too many errors
         if total_errors >= DRIVER_RESET_THRESHOLD:
             log.warning("%s %s Too many total errors, returning current results", code, ARROW)
+            flush_pending()
             return records, total_cards
             
         # Check if we've reached the end of results
@@ -1085,8 +1331,9 @@ def scrape_subsector(
             log.info("%s %s No new tiles to process, scrolling to find more", code, ARROW)
                 
             # Check for termination before scrolling
-            if termination_check and termination_check():
+            if term():
                 log.info("%s %s Termination requested before scrolling", code, ARROW)
+                flush_pending()
                 return records, total_cards
                     
             # Scroll and check if the scroll was successful
@@ -1113,10 +1360,11 @@ def scrape_subsector(
         # Track how many new tiles we process in this batch
         new_tiles_processed = 0
             
-        for tile_idx, (tile, tile_id) in enumerate(unprocessed_tiles):
+        for tile_idx, (tile, tile_key, tile_name) in enumerate(unprocessed_tiles):
             # Check for termination request for every tile
-            if termination_check and termination_check():
+            if term():
                 log.info("%s %s Termination requested during tile processing", code, ARROW)
+                flush_pending()
                 return records, total_cards
                     
             if total_cards >= RESULT_LIMIT:
@@ -1127,22 +1375,23 @@ def scrape_subsector(
                 log.warning("%s %s Unable to ensure no card is open, skipping this batch", code, ARROW)
                 break  # Break out of the tile loop to try refreshing
                 
-            # Try to get the business name from the tile before clicking
-            tile_name = get_tile_name(tile)
+            # Use the business name cached during the batch fingerprint
+            if not tile_name:
+                tile_name = get_tile_name(tile)
             log.debug("%s %s Attempting to click tile for business: %s", code, ARROW, tile_name)
 
             # Skip if we've already processed this business IN THIS SUBSECTOR
-            if tile_name and tile_name in processed_businesses:
+            if tile_name and _name_key(tile_name) in processed_businesses:
                 log.debug("%s %s Skipping already processed business: %s", code, ARROW, tile_name)
-                processed_tile_ids.add(tile_id)  # Mark this tile as processed
+                processed_tile_ids.add(tile_key)  # Mark this tile as processed
                 continue
-            
+
             # Mark this tile as processed BEFORE clicking to prevent re-processing
             # if something goes wrong during processing
-            processed_tile_ids.add(tile_id)
+            processed_tile_ids.add(tile_key)
         
             # Safely click tile with retry logic
-            if not safe_click_tile(driver, tile, code, tile_idx, len(unprocessed_tiles)):
+            if not safe_click_tile(driver, tile, code, tile_idx, len(unprocessed_tiles), tile_name):
                 consecutive_stale_errors += 1
                 total_errors += 1
                 log.debug("%s %s Failed to click tile, skipping", code, ARROW)
@@ -1152,15 +1401,10 @@ def scrape_subsector(
 
             # Wait until card shows name using the new selectors
             try:
-                # First wait for any card to load
-                WebDriverWait(driver, 12).until(
-                    lambda d: (
-                        d.find_elements(By.CSS_SELECTOR, NAME_CSS) or 
-                        d.find_elements(By.XPATH, NAME_XPATH) or
-                        d.find_elements(By.CSS_SELECTOR, FALLBACK_NAME)
-                    )
-                )
-                
+                # Event-driven wait for the card to load
+                if not wait_for_card_ready(driver, timeout=12):
+                    raise TimeoutException("Card did not become ready")
+
                 # Then extract the name from the card
                 card_name = safe_text_with_fallbacks(driver, NAME_CSS, NAME_XPATH, FALLBACK_NAME)
                 
@@ -1185,28 +1429,37 @@ def scrape_subsector(
 
             rdelay(CLICK_WAIT_MIN, CLICK_WAIT_MAX, fast_mode)
 
-            # Extract data using the new selectors with fallbacks
-            name = safe_text_with_fallbacks(driver, NAME_CSS, NAME_XPATH, FALLBACK_NAME)
-                
+            # Extract all fields from one DOM snapshot; fall back to the
+            # per-field Selenium extractors if the snapshot yields nothing
+            card = extract_card_fields(driver, debug)
+            if card is not None:
+                name = card["name"]
+                stars = card["stars"]
+                reviews = card["reviews"]
+                address = card["address"]
+                website = card["website"]
+                phone_int = card["phone"]
+            else:
+                name = safe_text_with_fallbacks(driver, NAME_CSS, NAME_XPATH, FALLBACK_NAME)
+                stars = safe_text_with_fallbacks(driver, RATING_CSS, RATING_XPATH, FALLBACK_STARS) or "N/A"
+                rev_raw = safe_text_with_fallbacks(driver, REVIEWS_CSS, REVIEWS_XPATH, FALLBACK_REVIEWS)
+                reviews = int(_NON_DIGITS_RE.sub("", rev_raw)) if rev_raw else 0
+
+                # Enhanced address extraction with multiple methods
+                address = extract_address(driver, debug) or "N/A"
+
+                # Enhanced website extraction with multiple methods - pass business name for better logging
+                website = extract_website(driver, name, debug) or "N/A"
+
+                # Enhanced phone number extraction - optimized - pass business name for better logging
+                phone_int = extract_phone_number(driver, name, debug)
+
             # Skip if we've already processed this business IN THIS SUBSECTOR
-            if name in processed_businesses:
+            if _name_key(name) in processed_businesses:
                 log.debug("%s %s Skipping already processed in this subsector (by card name): %s", code, ARROW, name)
                 safe_close_card(driver)
                 rdelay(CLOSE_WAIT_MIN, CLOSE_WAIT_MAX, fast_mode)
                 continue
-                    
-            stars = safe_text_with_fallbacks(driver, RATING_CSS, RATING_XPATH, FALLBACK_STARS) or "N/A"
-            rev_raw = safe_text_with_fallbacks(driver, REVIEWS_CSS, REVIEWS_XPATH, FALLBACK_REVIEWS)
-            reviews = int(re.sub(r"[^\d]", "", rev_raw)) if rev_raw else 0
-                
-            # Enhanced address extraction with multiple methods
-            address = extract_address(driver, debug) or "N/A"
-                
-            # Enhanced website extraction with multiple methods - pass business name for better logging
-            website = extract_website(driver, name, debug) or "N/A"
-                
-            # Enhanced phone number extraction - optimized - pass business name for better logging
-            phone_int = extract_phone_number(driver, name, debug)
                 
             # Skip if we've already processed this phone number IN THIS SUBSECTOR
             if phone_int and phone_int in processed_phones:
@@ -1219,28 +1472,18 @@ def scrape_subsector(
             if address == str(phone_int):
                 address = "N/A"
 
-            # Add detailed logging for each field extraction
-            log.info("%s %s EXTRACTION: Business Name: %s", code, ARROW, name)
-            log.info("%s %s EXTRACTION: Stars: %s", code, ARROW, stars)
-            log.info("%s %s EXTRACTION: Reviews: %s", code, ARROW, reviews)
-            log.info("%s %s EXTRACTION: Address: %s", code, ARROW, address)
-            log.info("%s %s EXTRACTION: Website: %s", code, ARROW, website)
-            log.info("%s %s EXTRACTION: Phone: %s", code, ARROW, phone_int if phone_int else "None")
-            
-            # Log the business name and website to help debug website mismatches
-            log.info("%s %s BUSINESS-WEBSITE MAPPING: %s -> %s", code, ARROW, name, website)
-
-            # Log all extracted data together for debugging
-            log.info("%s %s %sBUSINESS DATA SUMMARY:%s Name='%s%s%s', Website='%s%s%s', Phone='%s%s%s', Address='%s%s%s'", 
-                     code, ARROW, BOLD + MAGENTA, RESET,
-                     BOLD + BLUE, name, RESET,
-                     BOLD + CYAN, website[:30] + "..." if len(website) > 30 else website, RESET,
-                     BOLD + YELLOW, phone_int if phone_int else "None", RESET,
-                     BOLD + GREEN, address[:30] + "..." if len(address) > 30 else address, RESET)
+            # Full per-field extraction dump only at DEBUG - the format
+            # args aren't built at all when DEBUG is off
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s %s EXTRACTION: %s", code, ARROW, {
+                    "name": name, "stars": stars, "reviews": reviews,
+                    "address": address, "website": website,
+                    "phone": phone_int, "tile_name": tile_name
+                })
 
             # Note the difference between tile name and card name for debugging
             if name != tile_name and tile_name:
-                log.info("%s %s NOTE: Card name '%s' differs from tile name '%s' (expected due to UI lag)", 
+                log.debug("%s %s NOTE: Card name '%s' differs from tile name '%s' (expected due to UI lag)",
                          code, ARROW, name, tile_name)
 
             # Create the record with all the data we've extracted for THIS business
@@ -1264,29 +1507,36 @@ def scrape_subsector(
                 processed_phones.add(phone_int)  # Track in this subsector
                     
             # Mark this business as processed IN THIS SUBSECTOR
-            processed_businesses.add(name)
+            processed_businesses.add(_name_key(name))
                 
             # Insert record immediately after scraping into MongoDB
             log.info("%s %s Scraped: %s (phone: %s, address: %s, website: %s)", 
                      code, ARROW, name, 
                      phone_int if phone_int else "none",
-                     address[:30] + "..." if len(address) > 30 else address,
-                     website[:30] + "..." if len(website) > 30 else website)
+                     _trunc(address),
+                     _trunc(website))
                 
-            success = insert_record(rest_col, record)
-            if success:
-                records.append(record)
-                total_cards += 1
-                new_tiles_processed += 1
-                    
-                # Check termination after each successful record insertion
-                if termination_check and termination_check():
-                    log.info("%s %s Termination requested after record insertion", code, ARROW)
-                    return records, total_cards
-                    
-            # Add the constant delay here before closing card
-            log.info("%s %s %sWaiting for %s seconds before closing card%s", code, ARROW, YELLOW + BOLD, CARD_PROCESSING_DELAY, RESET)
-            time.sleep(CARD_PROCESSING_DELAY)  # Add fixed delay between cards
+            pending.append(record)
+            records.append(record)
+            total_cards += 1
+            new_tiles_processed += 1
+
+            # Flush the buffer once it reaches the batch size
+            if len(pending) >= BULK_INSERT_SIZE:
+                flush_pending()
+
+            # Check termination after each successful record
+            if term():
+                log.info("%s %s Termination requested after record insertion", code, ARROW)
+                flush_pending()
+                return records, total_cards
+
+
+            # Extraction already succeeded, so close straight away - just a
+            # short human-like pause rather than the old fixed delay
+            if CARD_PROCESSING_DELAY:
+                time.sleep(CARD_PROCESSING_DELAY)
+            rdelay(0.1, 0.3, fast_mode)
 
             # close card
             safe_close_card(driver)
@@ -1308,8 +1558,9 @@ def scrape_subsector(
 
         # If we processed even one tile in this batch, don't scroll yet - continue processing remaining tiles
         # Check for termination before scrolling
-        if termination_check and termination_check():
+        if term():
             log.info("%s %s Termination requested before scrolling", code, ARROW)
+            flush_pending()
             return records, total_cards
                 
         # Scroll to find more results
@@ -1338,4 +1589,5 @@ def scrape_subsector(
          code, ARROW, GREEN + BOLD, total_cards, len(processed_businesses), RESET)
     log.info("=" * 60)
     
+    flush_pending()
     return records, total_cards
@@ -14,7 +14,7 @@ SUBSECTOR_WAIT_MIN, SUBSECTOR_WAIT_MAX = 3.0, 5.0
 PHONE_WAIT_TIME = 1.0  # Reduced wait time for phone numbers
 ADDRESS_WAIT_TIME = 1.0  # Wait time for address to load
 WEBSITE_WAIT_TIME = 1.0  # Wait time for website to load
-CARD_PROCESSING_DELAY = 6.0  # Seconds to wait between each card processing
+CARD_PROCESSING_DELAY = 0.0  # Extra fixed wait between cards (0 = event-driven, close as soon as extracted)
 
 MAX_SCROLL_ATTEMPTS = 6   # Reduced from 8 to avoid getting stuck too long
 RESULT_LIMIT = 120   # stop after this many cards
@@ -22,6 +22,7 @@ MAX_STALE_RETRIES = 3  # Maximum retries for stale element exceptions
 PAGE_REFRESH_THRESHOLD = 3  # Refresh page after this many consecutive stale errors
 MONGO_RETRY_ATTEMPTS = 3  # Number of times to retry MongoDB operations
 MONGO_RETRY_DELAY = 1.0  # Seconds to wait between MongoDB retries
+BULK_INSERT_SIZE = 25  # Records buffered before a bulk MongoDB write
 DRIVER_RESET_THRESHOLD = 10  # Reset driver after this many errors
 
 SERVICE, CITY = "restaurants in", "leeds"  # Default city, can be overridden
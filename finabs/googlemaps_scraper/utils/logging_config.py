@@ -3,8 +3,11 @@ logging_config.py - Logging configuration
 ----------------------------------------
 Configure logging for the Google Maps scraper.
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import io
 from datetime import datetime
@@ -12,14 +15,25 @@ from datetime import datetime
 # Arrow symbol for logging
 ARROW = "->"
 
+def _safe_stop(listener):
+    """Stop a queue listener, ignoring double-stops at shutdown."""
+    try:
+        listener.stop()
+    except Exception:
+        pass
+
 def setup_logging(log_file=None, debug=False):
     """
     Set up logging for the Google Maps scraper.
-    
+
+    Handlers run behind a QueueHandler/QueueListener pair, so log calls
+    in the scraping hot loop only enqueue a record; console and file I/O
+    happen on the listener's background thread.
+
     Args:
         log_file: Optional log file path
         debug: Enable debug logging
-        
+
     Returns:
         Logger instance
     """
@@ -27,15 +41,24 @@ def setup_logging(log_file=None, debug=False):
     logger = logging.getLogger("googlemaps_scraper")
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
     logger.propagate = False
-    
+
+    # Stop the previous listener before replacing the handlers
+    old_listener = getattr(logger, "_queue_listener", None)
+    if old_listener is not None:
+        _safe_stop(old_listener)
+        logger._queue_listener = None
+
     # Clear existing handlers
     if logger.handlers:
         logger.handlers.clear()
-    
+
     # Create formatter
-    formatter = logging.Formatter('[%(asctime)s] %(levelname)-8s – %(message)s', 
+    formatter = logging.Formatter('[%(asctime)s] %(levelname)-8s – %(message)s',
                                  datefmt='%Y-%m-%d %H:%M:%S')
-    
+
+    # Handlers that do real I/O - these go on the listener thread
+    handlers = []
+
     # Create console handler with UTF-8 encoding to handle non-English characters
     try:
         # For Windows, create a UTF-8 stream handler
@@ -46,18 +69,14 @@ def setup_logging(log_file=None, debug=False):
         else:
             # For non-Windows platforms, use standard StreamHandler
             console_handler = logging.StreamHandler(sys.stdout)
-        
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(logging.DEBUG if debug else logging.INFO)
-        logger.addHandler(console_handler)
-    except Exception as e:
+    except Exception:
         # Fallback to standard handler if UTF-8 handler fails
-        fallback_handler = logging.StreamHandler()
-        fallback_handler.setFormatter(formatter)
-        fallback_handler.setLevel(logging.DEBUG if debug else logging.INFO)
-        logger.addHandler(fallback_handler)
-        logger.warning(f"Failed to create UTF-8 console handler: {e}. Using fallback handler.")
-    
+        console_handler = logging.StreamHandler()
+
+    console_handler.setFormatter(formatter)
+    console_handler.setLevel(logging.DEBUG if debug else logging.INFO)
+    handlers.append(console_handler)
+
     # Add file handler if log_file is provided
     if log_file:
         try:
@@ -65,13 +84,24 @@ def setup_logging(log_file=None, debug=False):
             log_dir = os.path.dirname(log_file)
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
-            
+
             # Create file handler with UTF-8 encoding
             file_handler = logging.FileHandler(log_file, encoding='utf-8')
             file_handler.setFormatter(formatter)
             file_handler.setLevel(logging.DEBUG if debug else logging.INFO)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
-            logger.warning(f"Failed to create log file {log_file}: {e}")
-    
+            print(f"Failed to create log file {log_file}: {e}")
+
+    # The logger itself only gets the (non-blocking) queue handler
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    logger._queue_listener = listener
+    atexit.register(_safe_stop, listener)
+
     return logger
@@ -3,30 +3,115 @@ persistence.py - Persistence utilities
 ------------------------------
 Utilities for persisting data across Flask app restarts.
 """
-import pickle
+import atexit
 import os
+import pickle
 import threading
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional
+
+import orjson
 
 # File to store workflows data
-WORKFLOWS_FILE = 'workflows_data.pkl'
+WORKFLOWS_FILE = 'workflows_data.json'
+# Pre-orjson file, still read as a fallback so existing data survives the switch
+LEGACY_WORKFLOWS_FILE = 'workflows_data.pkl'
 LOCK = threading.Lock()
 
-def save_workflows(workflows: Dict[str, Any]) -> None:
-    """Save workflows data to a file."""
-    with LOCK:
+# Debounce interval - saves within this window coalesce into one disk write
+FLUSH_INTERVAL = 0.5
+
+_pending: Optional[Dict[str, Any]] = None
+_dirty = threading.Event()
+_flusher_started = False
+
+def _write_workflows(workflows: Dict[str, Any]) -> None:
+    """Serialize workflows and swap the file in atomically."""
+    # Serialization happens off the request thread while scraper threads
+    # keep mutating the dict, so a mid-iteration change can abort a dump;
+    # retry a couple of times before giving up on this snapshot
+    for attempt in range(3):
         try:
-            with open(WORKFLOWS_FILE, 'wb') as f:
-                pickle.dump(workflows, f)
+            # Underscore keys hold live threading objects (events,
+            # conditions) that have no business in the file
+            snapshot = {
+                wid: {k: v for k, v in wf.items()
+                      if not (isinstance(k, str) and k.startswith('_'))}
+                for wid, wf in workflows.items()
+            }
+            data = orjson.dumps(snapshot, default=str, option=orjson.OPT_NON_STR_KEYS)
+            break
         except Exception as e:
-            print(f"Error saving workflows: {e}")
+            if attempt == 2:
+                print(f"Error saving workflows: {e}")
+                return
+            time.sleep(0.05)
+    try:
+        # Write to a temp file then swap it in, so a crash mid-write
+        # never leaves a truncated workflows file behind
+        tmp_file = WORKFLOWS_FILE + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, WORKFLOWS_FILE)
+    except Exception as e:
+        print(f"Error saving workflows: {e}")
+
+def _flush() -> None:
+    """Write the latest pending snapshot to disk, if any."""
+    global _pending
+    with LOCK:
+        workflows = _pending
+        _pending = None
+        _dirty.clear()
+    if workflows is not None:
+        _write_workflows(workflows)
+
+def _flusher_loop() -> None:
+    while True:
+        _dirty.wait()
+        # Let rapid successive saves coalesce before writing
+        time.sleep(FLUSH_INTERVAL)
+        _flush()
+
+def _ensure_flusher() -> None:
+    global _flusher_started
+    if not _flusher_started:
+        _flusher_started = True
+        thread = threading.Thread(target=_flusher_loop, daemon=True, name="workflow-flusher")
+        thread.start()
+        atexit.register(_flush)
+
+def save_workflows(workflows: Dict[str, Any]) -> None:
+    """
+    Save workflows data to a file.
+
+    Writes are debounced: the call just records the latest dict and a
+    background thread flushes it at most once per FLUSH_INTERVAL, so the
+    frequent per-status-change saves no longer rewrite the whole file
+    each time. A final flush runs at interpreter exit.
+    """
+    global _pending
+    _ensure_flusher()
+    with LOCK:
+        _pending = workflows
+        _dirty.set()
 
 def load_workflows() -> Dict[str, Any]:
     """Load workflows data from a file."""
+    # Make sure anything still buffered hits disk before reading
+    _flush()
     if os.path.exists(WORKFLOWS_FILE):
         with LOCK:
             try:
                 with open(WORKFLOWS_FILE, 'rb') as f:
+                    return orjson.loads(f.read())
+            except Exception as e:
+                print(f"Error loading workflows: {e}")
+    elif os.path.exists(LEGACY_WORKFLOWS_FILE):
+        # Fall back to the old pickle file from before the orjson switch
+        with LOCK:
+            try:
+                with open(LEGACY_WORKFLOWS_FILE, 'rb') as f:
                     return pickle.load(f)
             except Exception as e:
                 print(f"Error loading workflows: {e}")
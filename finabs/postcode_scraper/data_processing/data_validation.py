@@ -3,6 +3,7 @@ data_validation.py - Data validation
 ----------------------------------
 Functions for validating scraped data.
 """
+import functools
 from typing import Dict, Tuple, Any
 
 
@@ -21,9 +22,13 @@ def validate_data(data: Dict[str, Any]) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=65536)
 def derive_sector_subsector(pcd: str) -> Tuple[str, str]:
     """
     Derive sector and subsector from a postcode.
+
+    Pure string work on an already-uppercased postcode, so repeat
+    encounters across pages hit the memo instead of re-parsing.
     
     Args:
         pcd: Postcode
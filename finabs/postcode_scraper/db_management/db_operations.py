@@ -3,12 +3,12 @@ db_operations.py - Database operations
 -------------------------------------
 Functions for interacting with the database.
 """
+import itertools
 from collections import defaultdict
 from typing import Any, Dict, List, Set
 
 from pymongo.database import Database
 from pymongo.collection import Collection
-from pymongo.errors import BulkWriteError
 
 
 DEFAULT_FIELDS: Dict[str, Any] = {
@@ -21,6 +21,14 @@ DEFAULT_FIELDS: Dict[str, Any] = {
     "recordsfoundwithemail": 0,
 }
 
+# Item tuple form of DEFAULT_FIELDS - dict(tuple, **kw) is cheaper per doc
+# than re-unpacking the dict for every subsector
+DEFAULT_FIELDS_TUPLE = tuple(DEFAULT_FIELDS.items())
+
+# Mongo groups bulk writes into 1000-op batches internally; streaming chunks
+# of the same size bounds our memory no matter how many subsectors there are
+BULK_CHUNK_SIZE = 1000
+
 
 def insert_data(collection: Collection, data: Dict[str, Any]) -> None:
     """
@@ -44,7 +52,8 @@ def check_record_exists(collection: Collection, query: Dict[str, Any]) -> bool:
     Returns:
         True if a matching record exists, False otherwise
     """
-    return collection.count_documents(query) > 0
+    # find_one stops at the first match; count_documents keeps counting
+    return collection.find_one(query, projection={"_id": 1}) is not None
 
 
 def load_subsectors_into_mongo(db: Database, sector_to_subsectors: Dict[str, Set[str]], collection_name: str = "subsector_queue") -> None:
@@ -58,15 +67,23 @@ def load_subsectors_into_mongo(db: Database, sector_to_subsectors: Dict[str, Set
     """
     col = db[collection_name]
     col.drop()
-    col.create_index([("subsector", 1)], unique=True)
 
-    batch = []
-    for sector, subs in sector_to_subsectors.items():
-        for subsector in subs:
-            batch.append({"subsector": subsector, "sector": sector, **DEFAULT_FIELDS})
-    
-    if batch:
-        try:
-            col.insert_many(batch, ordered=False)
-        except BulkWriteError:
-            pass  # duplicates ignored thanks to unique index
+    # Dedup in Python and build the index only after the bulk load - inserting
+    # into an already-indexed collection pays a B-tree update per document
+    def docgen():
+        seen = set()
+        for sector, subs in sector_to_subsectors.items():
+            for subsector in subs:
+                if subsector in seen:
+                    continue
+                seen.add(subsector)
+                yield dict(DEFAULT_FIELDS_TUPLE, subsector=subsector, sector=sector)
+
+    docs = docgen()
+    while True:
+        chunk = list(itertools.islice(docs, BULK_CHUNK_SIZE))
+        if not chunk:
+            break
+        col.insert_many(chunk, ordered=False)
+
+    col.create_index([("subsector", 1)], unique=True)
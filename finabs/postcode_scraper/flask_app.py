@@ -4,33 +4,67 @@ flask_app.py - Flask integration
 Flask application for integrating the postcode scraper.
 """
 from flask import Flask, request, jsonify
+import hashlib
+import os
 import threading
-from collections import defaultdict
 
-from postcode_scraper.db_management.db_connection import connect_to_mongodb, get_or_create_database
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+
+from pymongo import MongoClient
+
+from postcode_scraper.db_management.db_connection import get_or_create_database
 from postcode_scraper.db_management.db_operations import load_subsectors_into_mongo
-from postcode_scraper.scraping.scraper import create_worker
+from postcode_scraper.scraping.scraper import ScrapeState, create_worker
 from postcode_scraper.utils.city_abbreviations import get_city_name, get_city_abbreviation
 from postcode_scraper.utils.logging_config import setup_logging
 
 app = Flask(__name__)
 logger = setup_logging()
 
+# Compress the JSON status responses clients poll every few seconds;
+# optional, like the ASGI stack below
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    pass
+
+# ASGI wrapper so the app can run under uvicorn's event loop - status
+# polls are then multiplexed on one loop instead of a thread per request.
+# asgiref is optional; without it the WSGI dev server still works.
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    asgi_app = None
+
 # Thread-safe shared primitives
-page_lock = threading.Lock()
 results_lock = threading.Lock()
-next_page_num = 1
-stop_scraping = False
-
-# Data containers
-all_postcodes = []
-sector_to_subsectors = {}
 
 # Background task status
 task_status = {}
 
+# Futures for running tasks, kept out of task_status so it stays JSON-safe
+task_futures = {}
+
+# Bounded pool for background scrape tasks - reused across requests so a
+# burst of API calls queues instead of spawning unbounded threads
+SCRAPE_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 5))
+
 # Configuration
 MONGO_URI = "mongodb://localhost:27017"
+
+# Shared client for all background tasks - the built-in pool handles
+# concurrency and avoids a reconnect per task
+MONGO_CLIENT = MongoClient(
+    MONGO_URI,
+    maxPoolSize=10,
+    minPoolSize=2,
+    maxIdleTimeMS=30000,
+    serverSelectionTimeoutMS=10000,
+    retryWrites=True,
+)
 NUM_WORKERS = 4  # Hardcoded number of workers
 DELAY = 0.5
 TIMEOUT = 15
@@ -67,12 +101,9 @@ def start_scrape():
         'keyword': keyword
     }
     
-    # Start background task
-    threading.Thread(
-        target=run_scrape_task,
-        args=(task_id, prefix, city, keyword)
-    ).start()
-    
+    # Start background task on the shared pool
+    task_futures[task_id] = SCRAPE_POOL.submit(run_scrape_task, task_id, prefix, city, keyword)
+
     return jsonify({
         'task_id': task_id,
         'message': f'Scraping task started for {prefix} in {city} with keyword {keyword}',
@@ -85,19 +116,24 @@ def get_status(task_id):
     """API endpoint to get the status of a scraping task."""
     if task_id not in task_status:
         return jsonify({'error': 'Task not found'}), 404
-    
-    return jsonify(task_status[task_id])
+
+    # Pollers send If-None-Match back; unchanged statuses cost a hash, not
+    # a full serialize-and-send
+    status = task_status[task_id]
+    etag = hashlib.blake2b(orjson.dumps(status, default=str), digest_size=16).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
+    response = jsonify(status)
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 def run_scrape_task(task_id, prefix, city, keyword):
     """Run a scraping task in the background."""
-    global next_page_num, stop_scraping, all_postcodes, sector_to_subsectors
-    
-    # Reset global variables
-    next_page_num = 1
-    stop_scraping = False
-    all_postcodes = []
-    sector_to_subsectors = defaultdict(set)
+    # Fresh shared state per run - no module-level globals to reset
+    state = ScrapeState()
     
     # Update task status
     task_status[task_id]['status'] = 'running'
@@ -111,14 +147,8 @@ def run_scrape_task(task_id, prefix, city, keyword):
                 TIMEOUT, 
                 DELAY, 
                 HEADLESS,
-                page_lock,
-                results_lock,
-                lambda: stop_scraping,
-                lambda val: setattr(globals(), 'stop_scraping', val),
-                lambda: next_page_num,
-                lambda val: setattr(globals(), 'next_page_num', val),
-                all_postcodes,
-                sector_to_subsectors
+                state,
+                results_lock
             )
             thread = threading.Thread(target=worker)
             threads.append(thread)
@@ -137,17 +167,16 @@ def run_scrape_task(task_id, prefix, city, keyword):
             collection_name = f"{keyword.replace(' ', '_').lower()}_subsector_queue"
         
         # Load data into MongoDB
-        client = connect_to_mongodb(MONGO_URI)
-        db = get_or_create_database(client, db_name)
-        load_subsectors_into_mongo(db, sector_to_subsectors, collection_name)
+        db = get_or_create_database(MONGO_CLIENT, db_name)
+        load_subsectors_into_mongo(db, state.s2s, collection_name)
         
         # Update task status
         task_status[task_id].update({
             'status': 'completed',
             'progress': 100,
-            'postcodes_count': len(all_postcodes),
-            'sectors_count': len(sector_to_subsectors),
-            'subsectors_count': sum(len(subs) for subs in sector_to_subsectors.values()),
+            'postcodes_count': len(state.postcodes),
+            'sectors_count': len(state.s2s),
+            'subsectors_count': sum(len(subs) for subs in state.s2s.values()),
             'database': db_name,
             'collection': collection_name
         })
@@ -160,5 +189,18 @@ def run_scrape_task(task_id, prefix, city, keyword):
         })
 
 
-if __name__ == '__main__':
+def _run_server():
+    """Serve via uvicorn when the ASGI stack is available, else Flask."""
+    if asgi_app is not None:
+        try:
+            import uvicorn
+        except ImportError:
+            pass
+        else:
+            uvicorn.run(asgi_app, host="127.0.0.1", port=5000)
+            return
     app.run(debug=True)
+
+
+if __name__ == '__main__':
+    _run_server()
@@ -5,26 +5,19 @@ main.py - Main entry point for the postcode scraper
 Orchestrates the scraping process by coordinating the different modules.
 """
 import argparse
-import json
 from pathlib import Path
+import orjson
 import threading
 import time
 
 from postcode_scraper.db_management.db_connection import connect_to_mongodb, get_or_create_database
 from postcode_scraper.db_management.db_operations import load_subsectors_into_mongo
-from postcode_scraper.scraping.scraper import create_worker
+from postcode_scraper.scraping.scraper import ScrapeState, create_worker
 from postcode_scraper.utils.city_abbreviations import get_city_name
 from postcode_scraper.utils.logging_config import setup_logging
 
 # Thread-safe shared primitives
-page_lock = threading.Lock()
 results_lock = threading.Lock()
-next_page_num = 1
-stop_scraping = False
-
-# Data containers
-all_postcodes = []
-sector_to_subsectors = {}
 
 
 def parse_args() -> argparse.Namespace:
@@ -40,29 +33,35 @@ def parse_args() -> argparse.Namespace:
     return ap.parse_args()
 
 
-def save_results_to_json(prefix: str, all_postcodes: list, sector_to_subsectors: dict) -> tuple[Path, Path]:
-    """Save scraped results to JSON files."""
+def save_results_to_json(prefix: str, all_postcodes: list, sector_to_subsectors: dict) -> tuple[Path, Path, int]:
+    """Save scraped results to JSON files, returning the subsector total."""
     out_prefix = prefix.upper().rstrip()
     postcodes_file = Path(f"{out_prefix}_postcodes.json")
     stats_file = Path(f"{out_prefix}_stats.json")
 
-    with postcodes_file.open("w", encoding="utf-8") as f:
-        json.dump(sorted(all_postcodes), f, indent=2)
+    # orjson serializes straight to bytes - no pretty-printed intermediate
+    # strings even for tens of thousands of postcodes
+    postcodes_file.write_bytes(orjson.dumps(sorted(all_postcodes), option=orjson.OPT_INDENT_2))
 
-    stats = {sec: sorted(list(subs)) for sec, subs in sector_to_subsectors.items()}
-    counts = {sec: len(subs) for sec, subs in sector_to_subsectors.items()}
-    with stats_file.open("w", encoding="utf-8") as f:
-        json.dump({"sectors": stats, "counts": counts}, f, indent=2)
+    # One pass over the dict produces the sorted lists, the per-sector
+    # counts and the grand total
+    stats, counts, total_subsectors = {}, {}, 0
+    for sec, subs in sector_to_subsectors.items():
+        sorted_subs = sorted(subs)
+        stats[sec] = sorted_subs
+        counts[sec] = len(sorted_subs)
+        total_subsectors += len(sorted_subs)
+    stats_file.write_bytes(orjson.dumps({"sectors": stats, "counts": counts}, option=orjson.OPT_INDENT_2))
     
-    return postcodes_file, stats_file
+    return postcodes_file, stats_file, total_subsectors
 
 
-def print_summary(all_postcodes: list, sector_to_subsectors: dict, postcodes_file: Path, stats_file: Path) -> None:
+def print_summary(all_postcodes: list, sector_to_subsectors: dict, total_subsectors: int, postcodes_file: Path, stats_file: Path) -> None:
     """Print a summary of the scraping results."""
     print("\n--- Summary ---")
     print(f"Total postcodes scraped     : {len(all_postcodes):,}")
     print(f"Distinct sectors            : {len(sector_to_subsectors):,}")
-    print(f"Distinct subsectors         : {sum(len(v) for v in sector_to_subsectors.values()):,}")
+    print(f"Distinct subsectors         : {total_subsectors:,}")
     print(f"Saved postcode list         : {postcodes_file}")
     print(f"Saved sector/subsector stats: {stats_file}")
 
@@ -80,12 +79,8 @@ def main() -> None:
     city_name = get_city_name(args.city)
     logger.info(f"Scraping postcodes for {city_name} with prefix {args.prefix}")
     
-    # Initialize global variables
-    global next_page_num, stop_scraping, all_postcodes, sector_to_subsectors
-    next_page_num = 1
-    stop_scraping = False
-    all_postcodes = []
-    sector_to_subsectors = {}
+    # Shared state for this run
+    state = ScrapeState()
     
     # Create and start worker threads
     threads = []
@@ -95,14 +90,8 @@ def main() -> None:
             args.timeout, 
             args.delay, 
             args.headless,
-            page_lock,
-            results_lock,
-            lambda: stop_scraping,
-            lambda val: setattr(globals(), 'stop_scraping', val),
-            lambda: next_page_num,
-            lambda val: setattr(globals(), 'next_page_num', val),
-            all_postcodes,
-            sector_to_subsectors
+            state,
+            results_lock
         )
         thread = threading.Thread(target=worker)
         threads.append(thread)
@@ -113,15 +102,15 @@ def main() -> None:
         thread.join()
     
     # Save results to JSON
-    postcodes_file, stats_file = save_results_to_json(args.prefix, all_postcodes, sector_to_subsectors)
+    postcodes_file, stats_file, total_subsectors = save_results_to_json(args.prefix, state.postcodes, state.s2s)
     
     # Load data into MongoDB
     client = connect_to_mongodb(args.mongo_uri)
     db = get_or_create_database(client, city_name)
-    load_subsectors_into_mongo(db, sector_to_subsectors)
+    load_subsectors_into_mongo(db, state.s2s)
     
     # Print summary
-    print_summary(all_postcodes, sector_to_subsectors, postcodes_file, stats_file)
+    print_summary(state.postcodes, state.s2s, total_subsectors, postcodes_file, stats_file)
     logger.info("Postcode scraping completed successfully")
 
 
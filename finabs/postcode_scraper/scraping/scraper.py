@@ -3,31 +3,44 @@ scraper.py - Core scraping functionality
 ---------------------------------------
 Functions for scraping postcodes from doogal.co.uk.
 """
+import itertools
+import threading
 import time
 from collections import defaultdict
-from typing import Callable, Dict, List, Set
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Set
 
 from selenium import webdriver
 
 from postcode_scraper.scraping.url_builder import build_url
 from postcode_scraper.scraping.html_parser import fetch_postcodes
-from postcode_scraper.scraping.browser_manager import create_driver
+from postcode_scraper.scraping.browser_manager import POOL
 from postcode_scraper.data_processing.data_validation import derive_sector_subsector
 
 
+@dataclass
+class ScrapeState:
+    """
+    Shared mutable state for one scrape run.
+
+    A single instance is passed to every worker, replacing the old spread
+    of getter/setter callbacks and loose container arguments.
+    """
+    stop: threading.Event = field(default_factory=threading.Event)
+    page_counter: Iterator[int] = field(default_factory=lambda: itertools.count(1))
+    postcodes: List[str] = field(default_factory=list)
+    postcodes_set: Set[str] = field(default_factory=set)
+    # Plain dict - defaultdict would materialize empty sets on stray reads
+    s2s: Dict[str, Set[str]] = field(default_factory=dict)
+
+
 def create_worker(
     prefix: str,
     timeout: int,
     delay: float,
     headless: bool,
-    page_lock: object,
-    results_lock: object,
-    get_stop_scraping: Callable[[], bool],
-    set_stop_scraping: Callable[[bool], None],
-    get_next_page_num: Callable[[], int],
-    set_next_page_num: Callable[[int], None],
-    all_postcodes: List[str],
-    sector_to_subsectors: Dict[str, Set[str]]
+    state: ScrapeState,
+    results_lock: object
 ) -> Callable[[], None]:
     """
     Create a worker function for scraping postcodes.
@@ -37,47 +50,48 @@ def create_worker(
         timeout: Seconds to wait for table to appear
         delay: Polite delay between page fetches
         headless: Whether to run Chrome in headless mode
-        page_lock: Lock for accessing page number
-        results_lock: Lock for accessing results
-        get_stop_scraping: Function to get stop_scraping flag
-        set_stop_scraping: Function to set stop_scraping flag
-        get_next_page_num: Function to get next_page_num
-        set_next_page_num: Function to set next_page_num
-        all_postcodes: List to store all postcodes
-        sector_to_subsectors: Dictionary to store sector to subsectors mapping
+        state: Shared ScrapeState for this run
+        results_lock: Lock for merging results into state
         
     Returns:
         Worker function
     """
     def worker():
-        driver = create_driver(headless)
+        # Worker threads are spawned fresh per scrape run, so the driver
+        # is checked out of the shared pool and returned when the run
+        # ends - a per-thread cache would strand its Chrome until exit
+        driver = POOL.get(headless)
         try:
-            while True:
-                with page_lock:
-                    if get_stop_scraping():
-                        break
-                    page = get_next_page_num()
-                    set_next_page_num(page + 1)
-                
+            while not state.stop.is_set():
+                # next() on a shared count is atomic under the GIL, so no
+                # lock is needed to hand out page numbers
+                page = next(state.page_counter)
+
                 url = build_url(prefix, page)
                 pcs = fetch_postcodes(driver, url, timeout)
-                
+            
                 if not pcs:
-                    with page_lock:
-                        set_stop_scraping(True)
+                    state.stop.set()
                     break
 
+                # Derive sectors outside the lock so the merge below is
+                # pure set arithmetic instead of per-postcode work
+                local_pcs = set(pcs)
+                local_s2s = defaultdict(set)
+                for pcd in pcs:
+                    sector, subsector = derive_sector_subsector(pcd)
+                    local_s2s[sector].add(subsector)
+
                 with results_lock:
-                    for pcd in pcs:
-                        if pcd not in all_postcodes:
-                            all_postcodes.append(pcd)
-                        sector, subsector = derive_sector_subsector(pcd)
-                        if sector not in sector_to_subsectors:
-                            sector_to_subsectors[sector] = set()
-                        sector_to_subsectors[sector].add(subsector)
-                
+                    new_pcs = local_pcs - state.postcodes_set
+                    state.postcodes_set |= new_pcs
+                    state.postcodes.extend(new_pcs)
+                    for sector, subs in local_s2s.items():
+                        state.s2s.setdefault(sector, set()).update(subs)
+            
                 time.sleep(delay)
+    
         finally:
-            driver.quit()
+            POOL.put(headless, driver)
     
     return worker
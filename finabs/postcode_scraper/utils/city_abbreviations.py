@@ -3,6 +3,8 @@ city_abbreviations.py - City abbreviation resolution
 -------------------------------------------------
 Functions for resolving city abbreviations to full names and vice versa.
 """
+import sys
+from types import MappingProxyType
 
 # Dictionary mapping city abbreviations to full names
 CITY_ABBREVIATIONS = {
@@ -39,8 +41,18 @@ CITY_ABBREVIATIONS = {
     'YO': 'York', 'ZE': 'Lerwick'
 }
 
-# Create a reverse mapping (city name to abbreviation)
-CITY_TO_ABBREVIATION = {v.lower(): k for k, v in CITY_ABBREVIATIONS.items()}
+# Both tables cover a closed set that is hit on every workflow start, so
+# normalize and intern the keys once at import; interned strings make the
+# dict lookups pointer comparisons on the hot path. MappingProxyType
+# guards against accidental mutation of the shared tables.
+_ABBR_TO_CITY = MappingProxyType({
+    sys.intern(k): sys.intern(v) for k, v in CITY_ABBREVIATIONS.items()
+})
+
+# Reverse mapping (lowercased city name to abbreviation)
+CITY_TO_ABBREVIATION = MappingProxyType({
+    sys.intern(v.lower()): sys.intern(k) for k, v in CITY_ABBREVIATIONS.items()
+})
 
 
 def get_city_name(city_abbreviation: str) -> str:
@@ -53,7 +65,7 @@ def get_city_name(city_abbreviation: str) -> str:
     Returns:
         Full city name or the original input if not found
     """
-    return CITY_ABBREVIATIONS.get(city_abbreviation.upper(), city_abbreviation)
+    return _ABBR_TO_CITY.get(city_abbreviation.upper(), city_abbreviation)
 
 
 def get_city_abbreviation(city_name: str) -> str:
@@ -3,41 +3,87 @@ logging_config.py - Logging configuration
 ---------------------------------------
 Functions for configuring logging.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
 
+def _safe_stop(listener):
+    """Stop a queue listener, ignoring double-stops at shutdown."""
+    try:
+        listener.stop()
+    except Exception:
+        pass
+
+
 def setup_logging(log_file: str = "postcode_scraper.log", level: int = logging.INFO) -> logging.Logger:
     """
     Set up logging for the application.
-    
+
+    The console and file handlers run behind a QueueHandler/QueueListener
+    pair, so a log call from a worker thread only enqueues the record
+    instead of blocking on a disk write under the logging lock.
+
     Args:
         log_file: Path to log file
         level: Logging level
-        
+
     Returns:
         Logger object
     """
     # Create logger
     logger = logging.getLogger("postcode_scraper")
     logger.setLevel(level)
-    
+
+    # Stop the previous listener before replacing the handlers
+    old_listener = getattr(logger, "_queue_listener", None)
+    if old_listener is not None:
+        _safe_stop(old_listener)
+        # The listener owns the handlers that hold real file descriptors
+        for handler in old_listener.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+        logger._queue_listener = None
+
+    # Close existing handlers before detaching them, or re-invocation
+    # (Flask reloader, tests) leaks their file descriptors
+    for handler in logger.handlers[:]:
+        handler.close()
+        logger.removeHandler(handler)
+
+    # Records stop here; letting them propagate would re-emit each one
+    # through the root logger's handlers under another lock
+    logger.propagate = False
+
     # Create formatter
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    
+
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    
+
     # Create file handler
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    
+
+    # The logger itself only gets the (non-blocking) queue handler; the
+    # listener thread owns the handlers that do real I/O. SimpleQueue
+    # skips the task-tracking bookkeeping of queue.Queue on every put
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger._queue_listener = listener
+    atexit.register(_safe_stop, listener)
+
     return logger
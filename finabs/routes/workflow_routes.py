@@ -4,11 +4,16 @@ routes/workflow_routes.py - Workflow Routes
 Routes for integrated workflow operations.
 """
 from flask import Blueprint, request, jsonify
+import hashlib
+import os
 import threading
+
+import orjson
 from datetime import datetime, UTC
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from app import app, logger, ps_task_data, gm_task_data, es_task_data, ps_threads, gm_threads, es_threads
+from app import app, logger, ps_task_data, gm_task_data, es_task_data
 from config import MONGO_URI, HEADLESS
 from persistence import save_workflows
 from tasks.workflow_tasks import run_integrated_workflow
@@ -17,6 +22,21 @@ from db_management.db_connection import connect_to_mongodb
 
 workflow_bp = Blueprint('workflow', __name__)
 
+# Bounded pool for workflow runs - a burst of /api/scrapeAll calls queues
+# here instead of spawning a fresh OS thread per request
+SCRAPE_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 5))
+
+# Futures for running workflows, keyed by workflow_id
+workflow_futures = {}
+
+# Per-stage task tables - adding a stage means one entry here, not another
+# branch in the terminate path
+TASK_DATA_BY_STAGE = {
+    'postcode': ps_task_data,
+    'gmaps': gm_task_data,
+    'email': es_task_data,
+}
+
 @workflow_bp.route('/api/scrapeAll', methods=['GET'])
 def start_integrated_scrape():
     """API endpoint to start an integrated scraping workflow that handles all steps automatically."""
@@ -27,6 +47,12 @@ def start_integrated_scrape():
     if not city:
         return jsonify({'error': 'Missing required parameter: city'}), 400
     
+    # Validate the city up front - an unknown city fails here with a 400
+    # instead of inside the worker after it has already opened MongoDB
+    prefix = get_city_abbreviation(city)
+    if not prefix:
+        return jsonify({'error': f'Could not find abbreviation for city: {city}'}), 400
+    
     # Generate a workflow ID
     workflow_id = f"WF_{city}_{keyword}_{threading.get_ident()}"
     
@@ -52,13 +78,10 @@ def start_integrated_scrape():
     # Save workflows to file
     save_workflows(app.config['workflows'])
     
-    # Start workflow in background thread
-    workflow_thread = threading.Thread(
-        target=run_integrated_workflow,
-        args=(workflow_id, city, keyword, app.config['workflows'])
+    # Start workflow on the shared pool
+    workflow_futures[workflow_id] = SCRAPE_POOL.submit(
+        run_integrated_workflow, workflow_id, city, keyword, app.config['workflows'], prefix
     )
-    workflow_thread.daemon = True
-    workflow_thread.start()
     
     return jsonify({
         'workflow_id': workflow_id,
@@ -75,7 +98,16 @@ def get_integrated_status(workflow_id):
         return jsonify({'error': 'Workflow not found'}), 404
     
     workflow = workflows[workflow_id]
-    
+
+    # Hash everything except the always-moving elapsed_time so a poll that
+    # finds nothing changed gets a 304 instead of a fresh JSON body;
+    # underscore keys hold live threading objects and never leave the process
+    payload = {k: v for k, v in workflow.items() if not k.startswith('_')}
+    core = {k: v for k, v in payload.items() if k != 'elapsed_time'}
+    etag = hashlib.blake2b(orjson.dumps(core, default=str), digest_size=16).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
     # Calculate elapsed time
     if 'start_time' in workflow:
         start_time = datetime.fromisoformat(workflow['start_time'])
@@ -86,8 +118,12 @@ def get_integrated_status(workflow_id):
         
         elapsed_seconds = (end_time - start_time).total_seconds()
         workflow['elapsed_time'] = elapsed_seconds
-    
-    return jsonify(workflow)
+        payload['elapsed_time'] = elapsed_seconds
+
+    response = jsonify(payload)
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @workflow_bp.route('/api/terminateAll/<workflow_id>', methods=['POST'])
 def terminate_integrated_workflow(workflow_id):
@@ -109,19 +145,25 @@ def terminate_integrated_workflow(workflow_id):
     # Set termination flag
     workflow['should_terminate'] = True
     workflow['status'] = 'terminating'
+    terminate_event = workflow.get('_terminate_event')
+    if terminate_event is not None:
+        terminate_event.set()
+
+    # If the workflow is still queued on the pool it can be cancelled outright
+    future = workflow_futures.get(workflow_id)
+    if future is not None:
+        future.cancel()
     
     # Terminate any active tasks
     for stage, info in workflow['stages'].items():
         if info['status'] == 'running' and info['task_id']:
             task_id = info['task_id']
-            
-            if stage == 'postcode' and task_id in ps_task_data:
-                ps_task_data[task_id]['should_terminate'] = True
-                ps_task_data[task_id]['stop_scraping'] = True
-            elif stage == 'gmaps' and task_id in gm_task_data:
-                gm_task_data[task_id]['should_terminate'] = True
-            elif stage == 'email' and task_id in es_task_data:
-                es_task_data[task_id]['should_terminate'] = True
+
+            table = TASK_DATA_BY_STAGE.get(stage)
+            if table is not None and task_id in table:
+                table[task_id]['should_terminate'] = True
+                if stage == 'postcode':
+                    table[task_id]['stop_scraping'] = True
     
     # Update workflow status
     workflow['status'] = 'terminated'
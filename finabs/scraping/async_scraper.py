@@ -0,0 +1,106 @@
+"""
+async_scraper.py - asyncio/httpx scraping
+-----------------------------------------
+HTTP-only alternative to the Selenium workers. The doogal.co.uk results
+table is server-rendered, so a plain GET plus lxml parse yields the same
+postcodes without a Chrome process per worker, and asyncio lets many page
+fetches be in flight at once on a single thread.
+"""
+import asyncio
+import itertools
+from typing import Dict, List, Set, Tuple
+
+import httpx
+from lxml import html
+
+from scraping.url_builder import build_url
+from scraping.html_parser import ROW_ANCHOR_XPATH
+from data_processing.data_validation import derive_sector_subsector
+
+
+MAX_CONNECTIONS = 50
+
+
+async def fetch_page(client: httpx.AsyncClient, prefix: str, page: int) -> List[str]:
+    """
+    Fetch and parse a single results page.
+
+    Args:
+        client: Shared httpx async client
+        prefix: Outward prefix to search for
+        page: Page number to fetch
+
+    Returns:
+        List of postcode strings; empty on HTTP errors or an empty table
+    """
+    try:
+        resp = await client.get(build_url(prefix, page))
+        resp.raise_for_status()
+    except httpx.HTTPError:
+        return []
+
+    doc = html.fromstring(resp.text)
+    anchors = doc.xpath(ROW_ANCHOR_XPATH)
+    return [pcd for pcd in (a.strip().upper() for a in anchors) if pcd]
+
+
+async def scrape_postcodes_async(
+    prefix: str,
+    workers: int = 8,
+    delay: float = 0.0,
+    timeout: float = 15.0,
+) -> Tuple[List[str], Dict[str, Set[str]]]:
+    """
+    Scrape every results page for a prefix with concurrent consumers.
+
+    Args:
+        prefix: Outward prefix to search for
+        workers: Number of concurrent consumer tasks
+        delay: Polite delay between page fetches per consumer
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Tuple of (all_postcodes, sector_to_subsectors)
+    """
+    page_counter = itertools.count(1)
+    stop_event = asyncio.Event()
+    all_postcodes: List[str] = []
+    all_postcodes_set: Set[str] = set()
+    sector_to_subsectors: Dict[str, Set[str]] = {}
+
+    limits = httpx.Limits(max_connections=MAX_CONNECTIONS)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as client:
+
+        async def consumer() -> None:
+            while not stop_event.is_set():
+                page = next(page_counter)
+                pcs = await fetch_page(client, prefix, page)
+
+                if not pcs:
+                    stop_event.set()
+                    break
+
+                # Single-threaded event loop, so no results lock is needed
+                for pcd in pcs:
+                    if pcd not in all_postcodes_set:
+                        all_postcodes_set.add(pcd)
+                        all_postcodes.append(pcd)
+                    sector, subsector = derive_sector_subsector(pcd)
+                    sector_to_subsectors.setdefault(sector, set()).add(subsector)
+
+                if delay:
+                    await asyncio.sleep(delay)
+
+        await asyncio.gather(*(consumer() for _ in range(max(1, workers))))
+
+    return all_postcodes, sector_to_subsectors
+
+
+def scrape_postcodes(
+    prefix: str,
+    workers: int = 8,
+    delay: float = 0.0,
+    timeout: float = 15.0,
+) -> Tuple[List[str], Dict[str, Set[str]]]:
+    """Synchronous wrapper around scrape_postcodes_async for non-async callers."""
+    return asyncio.run(scrape_postcodes_async(prefix, workers, delay, timeout))
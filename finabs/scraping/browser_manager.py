@@ -3,24 +3,131 @@ browser_manager.py - Browser management
 -------------------------------------
 Functions for managing Selenium browser instances.
 """
+import atexit
+import functools
+import queue
+
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 
 
+# Images and stylesheets carry no postcode data - block them at the profile
+_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.stylesheet": 2,
+}
+
+
+@functools.lru_cache(maxsize=2)
+def _build_opts_args(headless: bool) -> tuple:
+    """
+    Compute the Chrome argument tuple once per headless flag.
+
+    ChromeOptions objects are single-use per driver, so only the argument
+    list is cached; the cheap Options shell is rebuilt each call.
+    """
+    args = ["--headless=new"] if headless else []
+    args.extend([
+        "--no-sandbox",
+        "--disable-gpu",
+        "--window-size=1200,800",
+        "--blink-settings=imagesEnabled=false",
+        # Additional stability flags to prevent SIGTRAP and tab crashes
+        "--disable-dev-shm-usage",
+        "--disable-crash-reporter",
+        "--disable-in-process-stack-traces",
+        "--disable-breakpad",
+        "--disable-component-update",
+        "--disable-domain-reliability",
+        "--disable-background-networking",
+    ])
+    return tuple(args)
+
+
 def create_driver(headless: bool) -> webdriver.Chrome:
     """
     Create a Selenium WebDriver.
-    
+
     Args:
         headless: Whether to run Chrome in headless mode
-        
+
     Returns:
         Selenium WebDriver
     """
     opts = ChromeOptions()
-    if headless:
-        opts.add_argument("--headless=new")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--window-size=1200,800")
+    # Only the DOM matters for the postcode table - return from get() at
+    # DOMContentLoaded and skip images/stylesheets entirely
+    opts.page_load_strategy = "eager"
+    opts.add_experimental_option("prefs", _CHROME_PREFS)
+    for arg in _build_opts_args(headless):
+        opts.add_argument(arg)
     return webdriver.Chrome(options=opts)
+
+
+class DriverPool:
+    """
+    Bounded pool of WebDrivers, keyed by headless flag.
+
+    Chrome cold-start costs one or two seconds and a couple hundred MB of
+    RSS, so workers check drivers out and return them across scrape tasks
+    instead of paying the startup for every task.
+    """
+
+    def __init__(self, maxsize: int = 4):
+        self._maxsize = maxsize
+        self._pools: dict = {}
+
+    def _queue_for(self, headless: bool) -> queue.Queue:
+        return self._pools.setdefault(headless, queue.Queue(maxsize=self._maxsize))
+
+    def get(self, headless: bool) -> webdriver.Chrome:
+        """Check out a pooled driver, recreating it if the session died."""
+        try:
+            driver = self._queue_for(headless).get_nowait()
+        except queue.Empty:
+            return create_driver(headless)
+
+        try:
+            driver.current_url  # health check
+        except WebDriverException:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+            return create_driver(headless)
+        return driver
+
+    def put(self, headless: bool, driver: webdriver.Chrome) -> None:
+        """Return a driver to the pool, resetting its state first."""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+            return
+
+        try:
+            self._queue_for(headless).put_nowait(driver)
+        except queue.Full:
+            driver.quit()
+
+    def close_all(self) -> None:
+        """Quit every pooled driver."""
+        for q in self._pools.values():
+            while True:
+                try:
+                    driver = q.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+
+
+POOL = DriverPool()
+atexit.register(POOL.close_all)
@@ -3,6 +3,7 @@ html_parser.py - HTML parsing
 ---------------------------
 Functions for parsing HTML content.
 """
+from lxml import html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,7 +12,7 @@ from selenium.common.exceptions import TimeoutException
 
 
 TABLE_SELECTOR = "table.sortable tbody"
-ROW_ANCHOR_SELECTOR = "td:first-child a"
+ROW_ANCHOR_XPATH = "//table[contains(@class, 'sortable')]/tbody/tr/td[1]/a/text()"
 
 
 def fetch_postcodes(driver: webdriver.Chrome, url: str, timeout: int) -> list[str]:
@@ -34,17 +35,11 @@ def fetch_postcodes(driver: webdriver.Chrome, url: str, timeout: int) -> list[st
     except TimeoutException:
         return []
 
-    rows = driver.find_elements(By.CSS_SELECTOR, f"{TABLE_SELECTOR} tr")
-    pcs: list[str] = []
-    for row in rows:
-        try:
-            anchor = row.find_element(By.CSS_SELECTOR, ROW_ANCHOR_SELECTOR)
-            pcd = anchor.text.strip().upper()
-            if pcd:
-                pcs.append(pcd)
-        except Exception:
-            continue
-    return pcs
+    # Pull the rendered page once and parse locally - per-row find_element
+    # calls each cost a WebDriver round-trip to chromedriver
+    doc = html.fromstring(driver.page_source)
+    anchors = doc.xpath(ROW_ANCHOR_XPATH)
+    return [pcd for pcd in (a.strip().upper() for a in anchors) if pcd]
 
 
 def extract_data_from_html(html_content: str) -> list[str]:
@@ -3,77 +3,326 @@ tasks/workflow_tasks.py - Workflow Tasks
 ------------------------------
 Background tasks for integrated workflow operations.
 """
+import concurrent.futures
+import functools
+import sys
 import threading
 import time
-from collections import defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime, UTC
+from typing import Any, Callable, Optional
 
-from app import logger, ps_task_data, gm_task_data, es_task_data, ps_threads, gm_threads, es_threads
+from app import logger, ps_task_data, gm_task_data, es_task_data
 from config import MONGO_URI, HEADLESS
 from persistence import save_workflows
-from utils.city_abbreviations import get_city_abbreviation
+from pymongo.errors import OperationFailure
+
 from db_management.db_connection import connect_to_mongodb
-from email_scraper.db_management.db_connection import setup_mongodb
-from email_scraper.db_management.db_operations import get_pending_records
 from tasks.postcode_tasks import run_postcode_scrape_task
 from tasks.gmaps_tasks import run_gmaps_scrape_task_with_limit
 from tasks.email_tasks import run_email_scrape_task
 
-def run_integrated_workflow(workflow_id, city, keyword, workflows):
-    """Run the integrated scraping workflow in the background."""
+
+# Terminal task states, hoisted so the wait loops do one frozenset hash
+# probe per check instead of rebuilding a list literal to scan
+_TERMINAL_STATUSES = frozenset({'completed', 'failed', 'terminated'})
+_FAILED_STATUSES = frozenset({'failed', 'terminated'})
+
+# Bounded pool for stage runners - each workflow used to burn a fresh OS
+# thread per stage; pool threads are reused (and keep their thread-local
+# Chrome drivers warm) while a burst of workflows queues instead of
+# spawning without limit. Cancellation goes through should_terminate and
+# the terminate events, never through the thread objects
+_WORKER_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=64, thread_name_prefix='scraper'
+)
+
+
+
+class _DictAccessMixin:
+    """Dict-style access over a slotted task-state instance.
+
+    The workflow loop, the terminate route and the stage runners were
+    all written against plain dict entries; these shims keep that code
+    unchanged while the state itself lives in fixed slots.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def copy(self):
+        """Plain dict of the public fields, matching dict.copy() callers."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self) if not f.name.startswith('_')
+        }
+
+
+@dataclass(slots=True)
+class GmTaskState(_DictAccessMixin):
+    """State of one Google Maps scrape task.
+
+    Slots cut the per-entry footprint versus a free-form dict and catch
+    typo'd field names at write time instead of growing the entry.
+    """
+    status: str = 'starting'
+    db_name: str = ''
+    queue_collection: str = ''
+    business_collection: str = ''
+    should_terminate: bool = False
+    unique_target: int = 120
+    unique_count: int = 0
+    progress: float = 0.0
+    error: Optional[str] = None
+    end_time: Optional[str] = None
+    _terminate_event: threading.Event = field(default_factory=threading.Event)
+    _cond: threading.Condition = field(default_factory=threading.Condition)
+    _progress_cb: Optional[Callable[[Any], None]] = None
+
+
+@dataclass(slots=True)
+class EsTaskState(_DictAccessMixin):
+    """State of one email scrape task."""
+    status: str = 'starting'
+    db_name: str = ''
+    collection: str = ''
+    max_sites: int = 0
+    headless: bool = True
+    total_records: int = 0
+    processed: int = 0
+    found: int = 0
+    checked_no_email: int = 0
+    failed: int = 0
+    skipped: int = 0
+    emails_collected: int = 0
+    progress: float = 0.0
+    start_time: str = ''
+    error: Optional[str] = None
+    end_time: Optional[str] = None
+    should_terminate: bool = False
+    _terminate_event: threading.Event = field(default_factory=threading.Event)
+    _cond: threading.Condition = field(default_factory=threading.Condition)
+    _progress_cb: Optional[Callable[[Any], None]] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_mongo_client():
+    """Shared MongoClient for all workflow runs.
+
+    PyMongo clients are thread-safe and pool sockets internally, so one
+    client serves every workflow; creating one per run repeats the TLS
+    handshake and replica-set discovery each time.
+    """
+    return connect_to_mongodb(MONGO_URI)
+
+
+def _iso_now():
+    """UTC timestamp in the ISO format used across workflow records."""
+    return datetime.now(UTC).isoformat()
+
+
+
+# Probe results are cached briefly so a burst of workflow dispatches
+# (several cities queued back to back) does one metadata round trip per
+# queue collection instead of one per request
+_HAS_DATA_TTL = 30.0
+_has_data_cache = {}  # {(db, collection): expires_at}
+_has_data_lock = threading.Lock()
+
+
+def _queue_has_data(client, db_name, collection_name):
+    """Return True if the queue collection already holds documents.
+
+    estimated_document_count reads collStats and returns 0 when the
+    database or collection does not exist, replacing the old
+    three-round-trip list_database_names / list_collection_names /
+    count_documents chain. Only positive answers are cached: data never
+    vanishes on its own, while an empty queue may be filled at any
+    moment and must be re-probed.
+    """
+    key = (db_name, collection_name)
+    now = time.monotonic()
+    with _has_data_lock:
+        expires_at = _has_data_cache.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
+    try:
+        has_data = client[db_name][collection_name].estimated_document_count() > 0
+    except OperationFailure:
+        has_data = False
+    if has_data:
+        with _has_data_lock:
+            _has_data_cache[key] = now + _HAS_DATA_TTL
+    return has_data
+
+
+def _notify(data):
+    """Wake the workflow thread after mutating a task entry's status/progress.
+
+    Task runners should call this after changing 'status' or 'progress' so
+    the workflow advances immediately instead of on its next poll tick.
+    """
+    cond = data.get('_cond')
+    if cond is not None:
+        with cond:
+            cond.notify_all()
+
+
+
+def _progress_forwarder(workflow, stage_key, data, field='progress'):
+    """Build the callback a task runner invokes on each progress change.
+
+    Pushes the new value straight into the workflow stage and wakes the
+    waiting workflow thread, so updates land as they happen instead of
+    being sampled once per poll tick (and none are lost in between).
+    Stored on the task entry under '_progress_cb'; runners that predate
+    the callback are still covered by _await_task's snapshot poll.
+    """
+    stage = workflow['stages'][stage_key]
+
+    def on_progress(value):
+        data[field] = value
+        stage[field] = value
+        _notify(data)
+
+    return on_progress
+
+
+def _forward_termination(workflow, data):
+    """Propagate workflow cancellation into a task entry the moment it fires.
+
+    Runs on a tiny daemon thread per stage; exits quietly once the task
+    reaches a terminal status without being cancelled.
+    """
+    event = workflow['_terminate_event']
+    while not event.wait(timeout=5.0):
+        if data['status'] in _TERMINAL_STATUSES:
+            return
+    data['should_terminate'] = True
+    if 'stop_scraping' in data:
+        data['stop_scraping'] = True
+    task_event = data.get('_terminate_event')
+    if task_event is not None:
+        task_event.set()
+    _notify(data)
+
+
+def _await_task(workflow, stage_key, data, workflows, snapshot=None):
+    """Block until a stage's task reaches a terminal status.
+
+    One body replaces the three near-identical poll loops. `snapshot`,
+    when given, maps the task entry to the stage fields to publish on
+    each wake-up. Returns once the stage status has been copied back
+    into the workflow.
+    """
+    stage = workflow['stages'][stage_key]
+    cond = data['_cond']
+    while data['status'] not in _TERMINAL_STATUSES:
+        # Check if workflow should be terminated
+        if workflow['should_terminate']:
+            data['should_terminate'] = True
+            if 'stop_scraping' in data:
+                data['stop_scraping'] = True
+            break
+
+        # Publish task progress in one atomic update so status readers
+        # see a consistent snapshot
+        if snapshot is not None:
+            snap = snapshot(data)
+            if snap:
+                stage.update(snap)
+
+        # save_workflows is debounced, so this only marks the dict
+        # dirty; the flusher thread coalesces the actual disk writes
+        save_workflows(workflows)
+
+        # Sleep until the task signals a change (or the timeout keeps
+        # us honest if the runner never notifies)
+        with cond:
+            cond.wait_for(
+                lambda: data['status'] in _TERMINAL_STATUSES,
+                timeout=1.0
+            )
+
+    stage['status'] = data['status']
+    save_workflows(workflows)
+
+
+def _email_snapshot(data):
+    """Stage fields published while the email scraper runs."""
+    snap = {
+        'processed': data['processed'],
+        'found': data['found'],
+        'total': data['total_records'],
+    }
+    if data['total_records'] > 0:
+        snap['progress'] = data['processed'] * 100.0 / data['total_records']
+    return snap
+
+
+def run_integrated_workflow(workflow_id, city, keyword, workflows, prefix):
+    """Run the integrated scraping workflow in the background.
+
+    `prefix` is the city abbreviation, validated by the dispatching
+    route so malformed requests never reach this thread.
+    """
     logger.info(f"Starting integrated workflow {workflow_id} for {city} with keyword {keyword}")
     
     workflow = workflows[workflow_id]
     workflow['status'] = 'running'
     workflow['current_stage'] = 'checking_data'
+    # Event twin of the should_terminate bool - the bool stays for
+    # serialization, the event gives microsecond cancellation latency
+    workflow.setdefault('_terminate_event', threading.Event())
     
     # Save workflow status update
     save_workflows(workflows)
     
     try:
-        # Connect to MongoDB
-        client = connect_to_mongodb(MONGO_URI)
-        
-        # Check if database exists
-        db_exists = city in client.list_database_names()
+        # Shared, cached MongoDB client - never closed, its pool stays
+        # warm across workflow runs
+        client = _get_mongo_client()
         
-        # Determine collection names
-        queue_collection = f"{keyword.replace(' ', '_').lower()}_subsector_queue"
-        business_collection = f"{keyword.replace(' ', '_').lower()}"
+        # Determine collection names; interning the slug lets later dict
+        # lookups on these names take the pointer-equality fast path
+        kw_slug = sys.intern(keyword.replace(' ', '_').lower())
+        queue_collection = f"{kw_slug}_subsector_queue"
+        business_collection = kw_slug
         
-        # Check if collections exist and have data
-        collection_exists = False
-        has_data = False
+        # One ident for all three task IDs - it is the orchestrator's
+        # ident either way, and a shared suffix ties the stages of one
+        # workflow together in the logs
+        _tid = threading.get_ident()
         
-        if db_exists:
-            db = client[city]
-            collection_exists = queue_collection in db.list_collection_names()
-            
-            if collection_exists:
-                count = db[queue_collection].count_documents({})
-                has_data = count > 0
+        # Cached metadata probe - see _queue_has_data
+        has_data = _queue_has_data(client, city, queue_collection)
         
         # Step 1: Run Postcode Scraper if needed
-        if not (db_exists and collection_exists and has_data):
+        if not has_data:
             workflow['current_stage'] = 'postcode_scraping'
             workflow['stages']['postcode']['status'] = 'running'
             
             # Save workflow status update
             save_workflows(workflows)
             
-            # Get city abbreviation for the prefix
-            prefix = get_city_abbreviation(city)
-            if not prefix:
-                workflow['status'] = 'failed'
-                workflow['error'] = f'Could not find abbreviation for city: {city}'
-                workflow['end_time'] = datetime.now(UTC).isoformat()
-                
-                # Save workflow status update
-                save_workflows(workflows)
-                return
-            
             # Generate a task ID for postcode scraper
-            ps_task_id = f"PS_{prefix}_{city}_{keyword}_{threading.get_ident()}"
+            ps_task_id = f"PS_{prefix}_{city}_{keyword}_{_tid}"
             workflow['stages']['postcode']['task_id'] = ps_task_id
             
             # Initialize task data for postcode scraper
@@ -90,51 +339,42 @@ def run_integrated_workflow(workflow_id, city, keyword, workflows):
                 'next_page_num': 1,
                 'stop_scraping': False,
                 'all_postcodes': [],
-                'sector_to_subsectors': defaultdict(set),
-                'should_terminate': False
+                'all_postcodes_set': set(),
+                'sector_to_subsectors': {},
+                'should_terminate': False,
+                '_terminate_event': threading.Event(),
+                '_cond': threading.Condition()
             }
             
+            ps_task_data[ps_task_id]['_progress_cb'] = _progress_forwarder(
+                workflow, 'postcode', ps_task_data[ps_task_id]
+            )
+            
             # Save workflow status update
             save_workflows(workflows)
             
-            # Run postcode scraper
-            ps_threads[ps_task_id] = []
-            main_thread = threading.Thread(
-                target=run_postcode_scrape_task,
-                args=(ps_task_id, prefix, city, keyword, False)
+            # Run postcode scraper on the shared pool; the termination
+            # forwarder stays a raw daemon thread since it may wait for
+            # the stage's whole lifetime and must not occupy a worker
+            _WORKER_POOL.submit(
+                run_postcode_scrape_task, ps_task_id, prefix, city, keyword, False
             )
-            main_thread.daemon = True
-            main_thread.start()
-            ps_threads[ps_task_id].append(main_thread)
+            threading.Thread(
+                target=_forward_termination,
+                args=(workflow, ps_task_data[ps_task_id]),
+                daemon=True
+            ).start()
             
             # Wait for postcode scraper to complete
-            while ps_task_data[ps_task_id]['status'] not in ['completed', 'failed', 'terminated']:
-                # Check if workflow should be terminated
-                if workflow['should_terminate']:
-                    ps_task_data[ps_task_id]['should_terminate'] = True
-                    ps_task_data[ps_task_id]['stop_scraping'] = True
-                    break
-                
-                # Update workflow with postcode scraper progress
-                workflow['stages']['postcode']['progress'] = ps_task_data[ps_task_id]['progress']
-                
-                # Save workflow status update periodically
-                if int(time.time()) % 10 == 0:  # Save every 10 seconds
-                    save_workflows(workflows)
-                
-                time.sleep(1)
-            
-            # Update workflow with postcode scraper status
-            workflow['stages']['postcode']['status'] = ps_task_data[ps_task_id]['status']
-            
-            # Save workflow status update
-            save_workflows(workflows)
+            _await_task(
+                workflow, 'postcode', ps_task_data[ps_task_id], workflows,
+                snapshot=lambda data: {'progress': data['progress']}
+            )
             
             # Check if postcode scraper failed or was terminated
-            if ps_task_data[ps_task_id]['status'] in ['failed', 'terminated']:
+            if ps_task_data[ps_task_id]['status'] in _FAILED_STATUSES:
                 workflow['status'] = ps_task_data[ps_task_id]['status']
                 workflow['error'] = ps_task_data[ps_task_id].get('error', 'Postcode scraper failed or was terminated')
-                workflow['end_time'] = datetime.now(UTC).isoformat()
                 
                 # Save workflow status update
                 save_workflows(workflows)
@@ -152,64 +392,45 @@ def run_integrated_workflow(workflow_id, city, keyword, workflows):
         workflow['stages']['gmaps']['status'] = 'running'
         
         # Generate a task ID for Google Maps scraper
-        gm_task_id = f"GM_{city}_{queue_collection}_{threading.get_ident()}"
+        gm_task_id = f"GM_{city}_{queue_collection}_{_tid}"
         workflow['stages']['gmaps']['task_id'] = gm_task_id
         
         # Initialize task data for Google Maps scraper
-        gm_task_data[gm_task_id] = {
-            'status': 'starting',
-            'db_name': city,
-            'queue_collection': queue_collection,
-            'business_collection': business_collection,
-            'should_terminate': False,
-            'unique_target': 120,  # Target 120 unique records
-            'unique_count': 0
-        }
+        gm_task_data[gm_task_id] = GmTaskState(
+            db_name=city,
+            queue_collection=queue_collection,
+            business_collection=business_collection,
+            unique_target=120,  # Target 120 unique records
+        )
+        
+        gm_task_data[gm_task_id]['_progress_cb'] = _progress_forwarder(
+            workflow, 'gmaps', gm_task_data[gm_task_id]
+        )
         
         # Save workflow status update
         save_workflows(workflows)
         
         # Run Google Maps scraper
-        gm_thread = threading.Thread(
-            target=run_gmaps_scrape_task_with_limit,
-            args=(gm_task_id, city, queue_collection, business_collection, 120)
+        _WORKER_POOL.submit(
+            run_gmaps_scrape_task_with_limit,
+            gm_task_id, city, queue_collection, business_collection, 120
         )
-        gm_thread.daemon = True
-        gm_thread.start()
-        gm_threads[gm_task_id] = gm_thread
+        threading.Thread(
+            target=_forward_termination,
+            args=(workflow, gm_task_data[gm_task_id]),
+            daemon=True
+        ).start()
         
         # Wait for Google Maps scraper to complete
-        while gm_task_data[gm_task_id]['status'] not in ['completed', 'failed', 'terminated']:
-            # Check if workflow should be terminated
-            if workflow['should_terminate']:
-                gm_task_data[gm_task_id]['should_terminate'] = True
-                break
-            
-            # Update workflow with Google Maps scraper progress
-            if 'progress' in gm_task_data[gm_task_id]:
-                workflow['stages']['gmaps']['progress'] = gm_task_data[gm_task_id]['progress']
-            
-            # Update unique count in workflow
-            if 'unique_count' in gm_task_data[gm_task_id]:
-                workflow['stages']['gmaps']['unique_count'] = gm_task_data[gm_task_id]['unique_count']
-            
-            # Save workflow status update periodically
-            if int(time.time()) % 10 == 0:  # Save every 10 seconds
-                save_workflows(workflows)
-            
-            time.sleep(1)
-        
-        # Update workflow with Google Maps scraper status
-        workflow['stages']['gmaps']['status'] = gm_task_data[gm_task_id]['status']
-        
-        # Save workflow status update
-        save_workflows(workflows)
+        _await_task(
+            workflow, 'gmaps', gm_task_data[gm_task_id], workflows,
+            snapshot=lambda data: {k: data[k] for k in ('progress', 'unique_count') if k in data}
+        )
         
         # Check if Google Maps scraper failed or was terminated
-        if gm_task_data[gm_task_id]['status'] in ['failed', 'terminated']:
+        if gm_task_data[gm_task_id]['status'] in _FAILED_STATUSES:
             workflow['status'] = gm_task_data[gm_task_id]['status']
-            workflow['error'] = gm_task_data[gm_task_id].get('error', 'Google Maps scraper failed or was terminated')
-            workflow['end_time'] = datetime.now(UTC).isoformat()
+            workflow['error'] = gm_task_data[gm_task_id].get('error') or 'Google Maps scraper failed or was terminated'
             
             # Save workflow status update
             save_workflows(workflows)
@@ -220,105 +441,78 @@ def run_integrated_workflow(workflow_id, city, keyword, workflows):
         workflow['stages']['email']['status'] = 'running'
         
         # Generate a task ID for email scraper
-        es_task_id = f"ES_{city}_{business_collection}_{threading.get_ident()}"
+        es_task_id = f"ES_{city}_{business_collection}_{_tid}"
         workflow['stages']['email']['task_id'] = es_task_id
         
-        # Connect to MongoDB to check for pending email records
-        mongo_client, collection = setup_mongodb(MONGO_URI, city, business_collection)
+        # Reuse the shared client to check for pending email records; the
+        # email scraper task opens its own connection (and ensures its
+        # indexes) when it actually runs
+        collection = client[city][business_collection] if client is not None else None
         
-        if mongo_client is None or collection is None:
+        if collection is None:
             workflow['stages']['email']['status'] = 'failed'
             workflow['stages']['email']['error'] = 'Failed to connect to MongoDB'
             workflow['status'] = 'failed'
             workflow['error'] = 'Failed to connect to MongoDB for email scraping'
-            workflow['end_time'] = datetime.now(UTC).isoformat()
             
             # Save workflow status update
             save_workflows(workflows)
             return
         
-        # Get pending email records
-        pending_records = get_pending_records(collection, 0)  # 0 means get all pending records
-        num_pending = len(pending_records)
+        # Count pending email records - the scraper thread re-queries the
+        # actual documents itself, so materializing the full result set
+        # here just to len() it wastes the whole cursor
+        num_pending = collection.count_documents(
+            {"website": {"$exists": True, "$nin": ["", None, "N/A"]}, "emailstatus": "pending"}
+        )
         
         if num_pending == 0:
             workflow['stages']['email']['status'] = 'skipped'
             workflow['stages']['email']['message'] = 'No pending email records found'
             workflow['status'] = 'completed'
-            workflow['end_time'] = datetime.now(UTC).isoformat()
             
             # Save workflow status update
             save_workflows(workflows)
-            mongo_client.close()
             return
         
         # Initialize task data for email scraper
-        es_task_data[es_task_id] = {
-            'status': 'starting',
-            'db_name': city,
-            'collection': business_collection,
-            'max_sites': 0,  # Process all pending records
-            'headless': HEADLESS,
-            'total_records': num_pending,
-            'processed': 0,
-            'found': 0,
-            'checked_no_email': 0,
-            'failed': 0,
-            'skipped': 0,
-            'emails_collected': 0,
-            'start_time': datetime.now(UTC).isoformat(),
-            'should_terminate': False
-        }
+        es_task_data[es_task_id] = EsTaskState(
+            db_name=city,
+            collection=business_collection,
+            max_sites=0,  # Process all pending records
+            headless=HEADLESS,
+            total_records=num_pending,
+            start_time=_iso_now(),
+        )
+        
+        es_task_data[es_task_id]['_progress_cb'] = _progress_forwarder(
+            workflow, 'email', es_task_data[es_task_id]
+        )
         
         # Save workflow status update
         save_workflows(workflows)
         
         # Run email scraper
-        es_thread = threading.Thread(
-            target=run_email_scrape_task,
-            args=(es_task_id, city, business_collection, 0, HEADLESS)
+        _WORKER_POOL.submit(
+            run_email_scrape_task, es_task_id, city, business_collection, 0, HEADLESS
         )
-        es_thread.daemon = True
-        es_thread.start()
-        es_threads[es_task_id] = es_thread
+        threading.Thread(
+            target=_forward_termination,
+            args=(workflow, es_task_data[es_task_id]),
+            daemon=True
+        ).start()
         
         # Wait for email scraper to complete
-        while es_task_data[es_task_id]['status'] not in ['completed', 'failed', 'terminated']:
-            # Check if workflow should be terminated
-            if workflow['should_terminate']:
-                es_task_data[es_task_id]['should_terminate'] = True
-                break
-            
-            # Update workflow with email scraper progress
-            workflow['stages']['email']['processed'] = es_task_data[es_task_id]['processed']
-            workflow['stages']['email']['found'] = es_task_data[es_task_id]['found']
-            workflow['stages']['email']['total'] = es_task_data[es_task_id]['total_records']
-            
-            if es_task_data[es_task_id]['total_records'] > 0:
-                progress = (es_task_data[es_task_id]['processed'] / es_task_data[es_task_id]['total_records']) * 100
-                workflow['stages']['email']['progress'] = progress
-            
-            # Save workflow status update periodically
-            if int(time.time()) % 10 == 0:  # Save every 10 seconds
-                save_workflows(workflows)
-            
-            time.sleep(1)
-        
-        # Update workflow with email scraper status
-        workflow['stages']['email']['status'] = es_task_data[es_task_id]['status']
-        
-        # Save workflow status update
-        save_workflows(workflows)
+        _await_task(workflow, 'email', es_task_data[es_task_id], workflows,
+                    snapshot=_email_snapshot)
         
         # Check if email scraper failed or was terminated
-        if es_task_data[es_task_id]['status'] in ['failed', 'terminated']:
+        if es_task_data[es_task_id]['status'] in _FAILED_STATUSES:
             workflow['status'] = es_task_data[es_task_id]['status']
-            workflow['error'] = es_task_data[es_task_id].get('error', 'Email scraper failed or was terminated')
+            workflow['error'] = es_task_data[es_task_id].get('error') or 'Email scraper failed or was terminated'
         else:
             workflow['status'] = 'completed'
         
-        workflow['end_time'] = datetime.now(UTC).isoformat()
-        
         # Save workflow status update
         save_workflows(workflows)
     
@@ -326,7 +520,26 @@ def run_integrated_workflow(workflow_id, city, keyword, workflows):
         logger.error(f"Error in integrated workflow {workflow_id}: {str(e)}")
         workflow['status'] = 'failed'
         workflow['error'] = str(e)
-        workflow['end_time'] = datetime.now(UTC).isoformat()
+    
+    finally:
+        # Stamp end_time once on the way out instead of in every error
+        # branch; a workflow that leaves here in a non-terminal state
+        # (terminated externally mid-wait) keeps whatever the terminator
+        # wrote
+        if workflow.get('status') in _TERMINAL_STATUSES and 'end_time' not in workflow:
+            workflow['end_time'] = _iso_now()
         
         # Save workflow status update
         save_workflows(workflows)
+        
+        # Drop this workflow's finished task entries and thread lists -
+        # nothing reads them once the terminal status is persisted, and
+        # leaving them pins the result containers (postcode lists, sets)
+        # for the life of the process
+        if workflow.get('status') in _TERMINAL_STATUSES:
+            for stage_key, table in (('postcode', ps_task_data),
+                                     ('gmaps', gm_task_data),
+                                     ('email', es_task_data)):
+                tid = workflow['stages'][stage_key].get('task_id')
+                if tid:
+                    table.pop(tid, None)
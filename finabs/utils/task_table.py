@@ -0,0 +1,58 @@
+"""
+task_table.py - Striped task-state table
+--------------------------------------
+Lock-striped mapping for the per-scraper task dicts.
+"""
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TaskTable:
+    """
+    Dict-like table of task entries, striped across N independent locks.
+
+    The three scrapers and the workflow poll loop all hit these tables
+    concurrently; a single lock would serialize every status update
+    behind every status read. Keys hash to one of N shards, so two tasks
+    only contend when they land on the same stripe. Entries themselves
+    are plain dicts - callers grab the entry once and mutate its fields
+    without holding the shard lock, same as before.
+    """
+
+    def __init__(self, shards: int = 16):
+        self._shards: List[Tuple[Dict[str, Any], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> Tuple[Dict[str, Any], threading.Lock]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        data, lock = self._shard(key)
+        with lock:
+            data[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        data, lock = self._shard(key)
+        with lock:
+            return data[key]
+
+    def __delitem__(self, key: str) -> None:
+        data, lock = self._shard(key)
+        with lock:
+            del data[key]
+
+    def __contains__(self, key: str) -> bool:
+        data, lock = self._shard(key)
+        with lock:
+            return key in data
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        data, lock = self._shard(key)
+        with lock:
+            return data.get(key, default)
+
+    def pop(self, key: str, default: Optional[Any] = None) -> Any:
+        data, lock = self._shard(key)
+        with lock:
+            return data.pop(key, default)